@@ -5,7 +5,6 @@ from __future__ import annotations
 
 import time
 import threading
-import queue
 import traceback
 import random
 from typing import List, Tuple, Dict, Any, TYPE_CHECKING
@@ -22,6 +21,7 @@ from .smart_tracker import SmartTracker
 
 if TYPE_CHECKING:
     from .config import Config
+    from .latest_frame import LatestFrame
     import onnxruntime as ort
 
 
@@ -59,19 +59,6 @@ def _update_crosshair_position(config: Config, half_width: int, half_height: int
         config.crosshairX, config.crosshairY = half_width, half_height
 
 
-def _clear_queues(boxes_queue: queue.Queue, confidences_queue: queue.Queue) -> None:
-    """清空檢測隊列"""
-    try:
-        while not boxes_queue.empty():
-            boxes_queue.get_nowait()
-        while not confidences_queue.empty():
-            confidences_queue.get_nowait()
-    except queue.Empty:
-        pass
-    boxes_queue.put([])
-    confidences_queue.put([])
-
-
 def _calculate_detection_region(
     config: Config, 
     crosshair_x: int, 
@@ -311,42 +298,11 @@ def _process_aiming(
         pid_y.reset()
 
 
-def _update_queues(
-    overlay_boxes_queue: queue.Queue,
-    overlay_confidences_queue: queue.Queue,
-    boxes: List[List[float]],
-    confidences: List[float],
-    auto_fire_queue: queue.Queue | None = None,
-) -> None:
-    """更新檢測結果隊列，並向自動開火單獨佇列廣播"""
-    try:
-        if overlay_boxes_queue.full():
-            overlay_boxes_queue.get_nowait()
-        if overlay_confidences_queue.full():
-            overlay_confidences_queue.get_nowait()
-    except queue.Empty:
-        pass
-
-    overlay_boxes_queue.put(boxes)
-    overlay_confidences_queue.put(confidences)
-
-    if auto_fire_queue is not None:
-        try:
-            if auto_fire_queue.full():
-                auto_fire_queue.get_nowait()
-        except queue.Empty:
-            pass
-        # 將檢測框單獨複製給自動開火，避免被其他消費者取走
-        auto_fire_queue.put(list(boxes))
-
-
 def ai_logic_loop(
     config: Config,
     model: ort.InferenceSession,
     model_type: str,
-    overlay_boxes_queue: queue.Queue,
-    overlay_confidences_queue: queue.Queue,
-    auto_fire_boxes_queue: queue.Queue | None = None,
+    latest_frame: LatestFrame,
 ) -> None:
     """
     AI 推理和滑鼠控制的主要循環
@@ -355,8 +311,7 @@ def ai_logic_loop(
         config: 配置實例
         model: ONNX 模型會話
         model_type: 模型類型（目前僅支持 'onnx'）
-        boxes_queue: 檢測框隊列
-        confidences_queue: 置信度隊列
+        latest_frame: 最新檢測結果的共享緩衝區（覆蓋層與自動開火共用）
     """
     screen_capture = mss.mss()
     input_name = model.get_inputs()[0].name
@@ -371,6 +326,9 @@ def ai_logic_loop(
     half_width = config.width // 2
     half_height = config.height // 2
 
+    # 取消旗標於啟動時取得：重啟後 config 換上新的 Event，不會讓本執行緒繼續執行
+    cancel_event = config.cancel_event
+
     # 延遲/性能統計（EMA）
     ema_total = 0.0
     ema_capture = 0.0
@@ -379,7 +337,7 @@ def ai_logic_loop(
     ema_post = 0.0
     last_stats_print = time.perf_counter()
 
-    while config.Running:
+    while config.Running and not cancel_event.is_set():
         try:
             loop_start = time.perf_counter()
             current_time = time.time()
@@ -404,7 +362,7 @@ def ai_logic_loop(
             is_aiming = bool(getattr(config, 'always_aim', False)) or any(is_key_pressed(k) for k in config.AimKeys)
             
             if not config.AimToggle or (not config.keep_detecting and not is_aiming):
-                _clear_queues(overlay_boxes_queue, overlay_confidences_queue)
+                latest_frame.clear()
                 # 清除追蹤預測視覺化
                 config.tracker_has_prediction = False
                 time.sleep(0.05)
@@ -434,6 +392,9 @@ def ai_logic_loop(
                 t2 = time.perf_counter()
                 outputs = model.run(None, {input_name: input_tensor})
                 t3 = time.perf_counter()
+                if cancel_event.is_set():
+                    # 推理期間已被要求停止（例如切換模型），不再移動滑鼠
+                    break
                 boxes, confidences = postprocess_outputs(
                     outputs, region['width'], region['height'], 
                     config.model_input_size, config.min_confidence, 
@@ -472,14 +433,8 @@ def ai_logic_loop(
                 pid_x.reset()
                 pid_y.reset()
 
-            # 更新隊列
-            _update_queues(
-                overlay_boxes_queue,
-                overlay_confidences_queue,
-                boxes,
-                confidences,
-                auto_fire_queue=auto_fire_boxes_queue,
-            )
+            # 發布最新檢測結果
+            latest_frame.publish(boxes, confidences)
 
             # 延遲/占用優化：用「總處理時間」扣掉 sleep，避免額外延遲疊加
             desired_interval = config.detect_interval if is_aiming else getattr(config, 'idle_detect_interval', config.detect_interval)
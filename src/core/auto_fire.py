@@ -3,7 +3,6 @@
 
 from __future__ import annotations
 
-import queue
 import time
 import traceback
 import logging
@@ -13,9 +12,10 @@ from win_utils import is_key_pressed, send_mouse_click
 
 if TYPE_CHECKING:
     from .config import Config
+    from .latest_frame import LatestFrame
 
 
-def auto_fire_loop(config: Config, boxes_queue: queue.Queue) -> None:
+def auto_fire_loop(config: Config, latest_frame: LatestFrame) -> None:
     """自動開火功能的獨立循環
     
     監聽自動開火按鍵，當準心位於檢測到的目標範圍內時自動觸發射擊。
@@ -23,7 +23,7 @@ def auto_fire_loop(config: Config, boxes_queue: queue.Queue) -> None:
     
     Args:
         config: 配置實例，包含自動開火相關設定
-        boxes_queue: 檢測框隊列，從 AI 推理循環獲取目標位置
+        latest_frame: 最新檢測結果的共享緩衝區，從 AI 推理循環獲取目標位置
     
     Note:
         此函數應在獨立的 daemon 線程中運行
@@ -33,9 +33,13 @@ def auto_fire_loop(config: Config, boxes_queue: queue.Queue) -> None:
     last_fire_time = 0
     cached_boxes = []
     last_box_update = 0
+    last_frame_id = -1
     logger = logging.getLogger(__name__)
     
     BOX_UPDATE_INTERVAL = 1 / 60  # 60Hz更新頻率
+
+    # 取消旗標於啟動時取得，重啟後舊執行緒會自行結束
+    cancel_event = config.cancel_event
     
     # 緩存按鍵配置
     auto_fire_key = config.auto_fire_key
@@ -43,7 +47,7 @@ def auto_fire_loop(config: Config, boxes_queue: queue.Queue) -> None:
     last_key_update = 0
     key_update_interval = 0.5  # 每0.5秒檢查一次按鍵配置變化
     
-    while config.Running:
+    while config.Running and not cancel_event.is_set():
         try:
             current_time = time.time()
             
@@ -71,15 +75,13 @@ def auto_fire_loop(config: Config, boxes_queue: queue.Queue) -> None:
                         # 更新檢測框緩存
                         if current_time - last_box_update >= BOX_UPDATE_INTERVAL:
                             try:
-                                # 從隊列中獲取最新的檢測結果（使用 get_nowait 替代直接訪問）
-                                if not boxes_queue.empty():
-                                    cached_boxes = boxes_queue.get_nowait()
+                                # 只在有新一幀結果時複製，否則沿用舊緩存
+                                snapshot = latest_frame.snapshot(last_frame_id)
+                                if snapshot is not None:
+                                    last_frame_id, cached_boxes, _ = snapshot
                                     last_box_update = current_time
-                            except queue.Empty:
-                                # 沒有新的資料，使用舊緩存
-                                pass
                             except Exception as e:
-                                logger.warning("AutoFire 讀取檢測隊列失敗: %s", e)
+                                logger.warning("AutoFire 讀取檢測結果失敗: %s", e)
                         
                         # 判斷是否應該開火
                         if cached_boxes:
@@ -6,6 +6,7 @@ from __future__ import annotations
 import ctypes
 import json
 import os
+import threading
 from typing import List, Dict, Any
 
 
@@ -53,6 +54,8 @@ class Config:
         # 程式執行狀態
         self.Running: bool = True
         self.AimToggle: bool = True
+        # 目前這一批 AI 執行緒的取消旗標（每次重啟執行緒時替換為新的 Event）
+        self.cancel_event: threading.Event = threading.Event()
         
         # ONNX 模型相關設定
         self.model_input_size: int = 640
@@ -61,6 +64,10 @@ class Config:
         # 混合運算：在 DirectML 不支援的算子時自動回退到 CPU
         # ONNX Runtime providers = ['DmlExecutionProvider', 'CPUExecutionProvider']
         self.dml_cpu_fallback: bool = True
+        # 優先使用離線量化的 INT8 模型 (<模型名>.int8.onnx，由 core.quantize_model 產生)
+        self.quantized_enabled: bool = False
+        # 使用自動轉換的 FP16 模型 (<模型名>.fp16.onnx，需安裝 onnx 與 onnxconverter-common)
+        self.fp16_enabled: bool = False
 
         # 瞄準與顯示設定
         self.AimKeys: List[int] = [0x01, 0x06, 0x02]  # 左鍵 + X2鍵 + 右鍵
@@ -162,7 +169,6 @@ class Config:
         
         # 優化：性能相關設置
         self.performance_mode: bool = True  # 預設啟用性能模式
-        self.max_queue_size: int = 1        # 減少隊列大小，降低延遲
 
         # 延遲/性能統計（預設關閉，避免輸出干擾）
         self.enable_latency_stats: bool = False
@@ -182,6 +188,8 @@ class Config:
             'model_input_size': self.model_input_size,
             'current_provider': self.current_provider,
             'dml_cpu_fallback': self.dml_cpu_fallback,
+            'quantized_enabled': self.quantized_enabled,
+            'fp16_enabled': self.fp16_enabled,
             'pid_kp_x': self.pid_kp_x,
             'pid_ki_x': self.pid_ki_x,
             'pid_kd_x': self.pid_kd_x,
@@ -214,7 +222,6 @@ class Config:
             'head_height_ratio': self.head_height_ratio,
             'body_width_ratio': self.body_width_ratio,
             'performance_mode': self.performance_mode,
-            'max_queue_size': self.max_queue_size,
             'enable_latency_stats': self.enable_latency_stats,
             'latency_stats_interval': self.latency_stats_interval,
             'latency_stats_alpha': self.latency_stats_alpha,
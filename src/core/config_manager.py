@@ -125,10 +125,11 @@ class ConfigManager:
             
             # 性能設定
             'performance_mode': config_instance.performance_mode,
-            'max_queue_size': config_instance.max_queue_size,
 
             # 模型回退
             'dml_cpu_fallback': getattr(config_instance, 'dml_cpu_fallback', True),
+            'quantized_enabled': getattr(config_instance, 'quantized_enabled', False),
+            'fp16_enabled': getattr(config_instance, 'fp16_enabled', False),
 
             # 滑鼠與手把控制
             'mouse_move_method': getattr(config_instance, 'mouse_move_method', 'mouse_event'),
@@ -1,39 +1,139 @@
 # key_listener.py
 """快捷鍵監聽模組 - 處理全域快捷鍵事件"""
 
+import ctypes
 import time
-import win32api
+from ctypes import wintypes
 
-from win_utils import get_vk_name
+from win_utils import get_vk_name, is_key_pressed
 
 
-def aim_toggle_key_listener(config, update_gui_callback=None):
-    """持續監聽自動瞄準開關快捷鍵
-    
-    在獨立線程中運行，監測指定按鍵的按下事件，
-    按下時切換 config.AimToggle 的狀態。
-    
-    Args:
-        config: 配置實例，需包含以下屬性：
-            - Running: bool，控制監聽循環是否繼續
-            - aim_toggle_key: int，切換用的虛擬按鍵碼
-            - AimToggle: bool，自動瞄準的開關狀態
-        update_gui_callback: 可選的回調函數，狀態變更時調用
-    
-    Note:
-        此函數應在 daemon 線程中運行，會在 config.Running 為 False 時結束
+WH_KEYBOARD_LL = 13
+HC_ACTION = 0
+WM_KEYDOWN = 0x0100
+WM_KEYUP = 0x0101
+WM_SYSKEYDOWN = 0x0104
+WM_SYSKEYUP = 0x0105
+PM_REMOVE = 0x0001
+QS_ALLINPUT = 0x04FF
+
+_KEY_DOWN_MESSAGES = frozenset((WM_KEYDOWN, WM_SYSKEYDOWN))
+_KEY_UP_MESSAGES = frozenset((WM_KEYUP, WM_SYSKEYUP))
+
+# 滑鼠按鍵 (VK_LBUTTON / VK_RBUTTON / VK_MBUTTON / VK_XBUTTON1 / VK_XBUTTON2)
+# 不會經過鍵盤鉤子，設定為這些按鍵時仍需輪詢
+_MOUSE_VK_CODES = frozenset((0x01, 0x02, 0x04, 0x05, 0x06))
+
+# 使用鍵盤鉤子時的訊息等待逾時（毫秒）：用於察覺快捷鍵被改成滑鼠按鍵，
+# 以及定期以 GetAsyncKeyState 交叉檢查鉤子是否仍然有效
+_HOOK_IDLE_TIMEOUT_MS = 100
+_POLL_INTERVAL_MS = 30  # 30ms 檢查間隔
+
+
+class KBDLLHOOKSTRUCT(ctypes.Structure):
+    _fields_ = [
+        ("vkCode", wintypes.DWORD),
+        ("scanCode", wintypes.DWORD),
+        ("flags", wintypes.DWORD),
+        ("time", wintypes.DWORD),
+        ("dwExtraInfo", ctypes.c_size_t),
+    ]
+
+
+_LRESULT = wintypes.LPARAM
+_HOOKPROC = ctypes.WINFUNCTYPE(_LRESULT, ctypes.c_int, wintypes.WPARAM, wintypes.LPARAM)
+_PKBDLLHOOKSTRUCT = ctypes.POINTER(KBDLLHOOKSTRUCT)
+
+try:
+    _user32 = ctypes.WinDLL("user32", use_last_error=True)
+    _kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+
+    _SetWindowsHookExW = _user32.SetWindowsHookExW
+    _SetWindowsHookExW.argtypes = [ctypes.c_int, _HOOKPROC, wintypes.HINSTANCE, wintypes.DWORD]
+    _SetWindowsHookExW.restype = ctypes.c_void_p
+
+    _UnhookWindowsHookEx = _user32.UnhookWindowsHookEx
+    _UnhookWindowsHookEx.argtypes = [ctypes.c_void_p]
+    _UnhookWindowsHookEx.restype = wintypes.BOOL
+
+    _CallNextHookEx = _user32.CallNextHookEx
+    _CallNextHookEx.argtypes = [ctypes.c_void_p, ctypes.c_int, wintypes.WPARAM, wintypes.LPARAM]
+    _CallNextHookEx.restype = _LRESULT
+
+    _MsgWaitForMultipleObjects = _user32.MsgWaitForMultipleObjects
+    _MsgWaitForMultipleObjects.argtypes = [
+        wintypes.DWORD, ctypes.c_void_p, wintypes.BOOL, wintypes.DWORD, wintypes.DWORD
+    ]
+    _MsgWaitForMultipleObjects.restype = wintypes.DWORD
+
+    _PeekMessageW = _user32.PeekMessageW
+    _PeekMessageW.argtypes = [
+        ctypes.POINTER(wintypes.MSG), wintypes.HWND, wintypes.UINT, wintypes.UINT, wintypes.UINT
+    ]
+    _PeekMessageW.restype = wintypes.BOOL
+
+    _GetModuleHandleW = _kernel32.GetModuleHandleW
+    _GetModuleHandleW.argtypes = [wintypes.LPCWSTR]
+    _GetModuleHandleW.restype = wintypes.HMODULE
+except (AttributeError, OSError):
+    # 非 Windows 環境或無法取得 API：只能使用輪詢
+    _SetWindowsHookExW = None
+
+
+def _toggle_aim(config, update_gui_callback):
+    """切換自動瞄準狀態並通知 GUI"""
+    old_state = config.AimToggle
+    config.AimToggle = not config.AimToggle
+    print(f"[快捷鍵] 自動瞄準: {old_state} → {config.AimToggle}")
+
+    if update_gui_callback:
+        update_gui_callback(config.AimToggle)
+
+
+def _install_keyboard_hook(config, update_gui_callback):
+    """安裝低階鍵盤鉤子，僅在實際按鍵事件時被呼叫
+
+    Returns:
+        (鉤子句柄, 回調物件, 按下狀態)，回調物件需保持引用；
+        按下狀態為 [bool]，表示鉤子認為快捷鍵目前是否按住；安裝失敗時為 None
     """
+    pressed = [False]  # 過濾按住時的自動重複 WM_KEYDOWN
+
+    def _hook_proc(n_code, w_param, l_param):
+        if n_code == HC_ACTION:
+            try:
+                vk_code = ctypes.cast(l_param, _PKBDLLHOOKSTRUCT).contents.vkCode
+                if vk_code == getattr(config, 'aim_toggle_key', 0x78):
+                    if w_param in _KEY_DOWN_MESSAGES:
+                        if not pressed[0]:
+                            pressed[0] = True
+                            _toggle_aim(config, update_gui_callback)
+                    elif w_param in _KEY_UP_MESSAGES:
+                        pressed[0] = False
+            except Exception as e:
+                print(f"[快捷鍵監聽] 錯誤: {e}")
+        return _CallNextHookEx(None, n_code, w_param, l_param)
+
+    callback = _HOOKPROC(_hook_proc)
+    hook = _SetWindowsHookExW(WH_KEYBOARD_LL, callback, _GetModuleHandleW(None), 0)
+    if not hook:
+        return None
+    return hook, callback, pressed
+
+
+def _poll_key_listener(config, update_gui_callback):
+    """輪詢 GetAsyncKeyState 的備用監聽方式（鍵盤鉤子無法安裝時使用）"""
     last_state = False
     key_code = getattr(config, 'aim_toggle_key', 0x78)  # 備用預設值 F9 鍵（實際預設由 config.py 定義為 Insert 鍵）
-    
+
     # 獲取按鍵名稱
     key_name = get_vk_name(key_code)
-    
-    sleep_interval = 0.03  # 30ms 檢查間隔
-    
-    
+
+    sleep_interval = _POLL_INTERVAL_MS / 1000
+
+
     # 使用無限循環，因為此線程需要在應用程式整個生命週期內運行
-    # config.Running 會在重啟 AI 線程時被設為 False，不應影響快捷鍵監聽
+    # AI 線程重啟是透過 config.cancel_event 通知，與快捷鍵監聽無關
     while True:
         try:
             # 重新獲取快捷鍵設置
@@ -41,25 +141,102 @@ def aim_toggle_key_listener(config, update_gui_callback=None):
             if current_key_code != key_code:
                 key_code = current_key_code
                 key_name = get_vk_name(key_code)
-            
+
             # 檢測按鍵狀態
-            state = bool(win32api.GetAsyncKeyState(key_code) & 0x8000)
-            
+            state = is_key_pressed(key_code)
+
             # 檢測按鍵按下事件
             if state and not last_state:
-                old_state = config.AimToggle
-                config.AimToggle = not config.AimToggle
-                print(f"[快捷鍵] 自動瞄準: {old_state} → {config.AimToggle}")
-                
-                if update_gui_callback:
-                    update_gui_callback(config.AimToggle)
-            
+                _toggle_aim(config, update_gui_callback)
+
             last_state = state
-            
+
         except Exception as e:
             print(f"[快捷鍵監聽] 錯誤: {e}")
             import traceback
             traceback.print_exc()
-        
+
         time.sleep(sleep_interval)
 
+
+def aim_toggle_key_listener(config, update_gui_callback=None):
+    """持續監聽自動瞄準開關快捷鍵
+
+    在獨立線程中運行，監測指定按鍵的按下事件，
+    按下時切換 config.AimToggle 的狀態。
+    優先使用低階鍵盤鉤子並在訊息迴圈中等待，按鍵之間不佔用 CPU；
+    鉤子安裝失敗時退回輪詢 GetAsyncKeyState。
+
+    Args:
+        config: 配置實例，需包含以下屬性：
+            - Running: bool，控制監聽循環是否繼續
+            - aim_toggle_key: int，切換用的虛擬按鍵碼
+            - AimToggle: bool，自動瞄準的開關狀態
+        update_gui_callback: 可選的回調函數，狀態變更時調用
+
+    Note:
+        此函數應在 daemon 線程中運行；鉤子回調在此線程的訊息迴圈中執行
+    """
+    installed = None
+    if _SetWindowsHookExW is not None:
+        try:
+            installed = _install_keyboard_hook(config, update_gui_callback)
+        except Exception as e:
+            print(f"[快捷鍵監聽] 鍵盤鉤子安裝錯誤: {e}")
+    if installed is None:
+        print("[快捷鍵監聽] 無法安裝鍵盤鉤子，改用輪詢模式")
+        _poll_key_listener(config, update_gui_callback)
+        return
+
+    hook, callback, hook_pressed = installed
+    msg = wintypes.MSG()
+    msg_ref = ctypes.byref(msg)
+    mouse_last_state = False
+    key_code = getattr(config, 'aim_toggle_key', 0x78)
+    key_last_state = key_code not in _MOUSE_VK_CODES and is_key_pressed(key_code)
+
+    # 使用無限循環，因為此線程需要在應用程式整個生命週期內運行
+    # AI 線程重啟是透過 config.cancel_event 通知，與快捷鍵監聽無關
+    while True:
+        try:
+            key_code = getattr(config, 'aim_toggle_key', 0x78)
+            if key_code in _MOUSE_VK_CODES:
+                # 滑鼠按鍵不經過鍵盤鉤子，僅在此情況輪詢
+                state = is_key_pressed(key_code)
+                if state and not mouse_last_state:
+                    _toggle_aim(config, update_gui_callback)
+                mouse_last_state = state
+                timeout = _POLL_INTERVAL_MS
+            else:
+                mouse_last_state = False
+                timeout = _HOOK_IDLE_TIMEOUT_MS
+
+            # 等待訊息（鉤子回調在 PeekMessage 期間被派送）
+            _MsgWaitForMultipleObjects(0, None, False, timeout, QS_ALLINPUT)
+            while _PeekMessageW(msg_ref, None, 0, 0, PM_REMOVE):
+                pass
+
+            if key_code in _MOUSE_VK_CODES:
+                key_last_state = False
+                continue
+
+            # 交叉檢查：系統先呼叫低階鉤子才更新按鍵狀態，按鍵已按下而鉤子卻沒收到，
+            # 表示回調逾時 (LowLevelHooksTimeout) 後鉤子已被系統靜默移除
+            state = is_key_pressed(key_code)
+            if state and not key_last_state and not hook_pressed[0]:
+                print("[快捷鍵監聽] 鍵盤鉤子已失效，重新安裝")
+                _toggle_aim(config, update_gui_callback)  # 補上這次被漏掉的按鍵
+                _UnhookWindowsHookEx(hook)
+                installed = _install_keyboard_hook(config, update_gui_callback)
+                if installed is None:
+                    print("[快捷鍵監聽] 無法重新安裝鍵盤鉤子，改用輪詢模式")
+                    _poll_key_listener(config, update_gui_callback)
+                    return
+                hook, callback, hook_pressed = installed
+                hook_pressed[0] = True  # 按鍵仍按住中，避免自動重複的按下訊息再次觸發
+            key_last_state = state
+        except Exception as e:
+            print(f"[快捷鍵監聽] 錯誤: {e}")
+            import traceback
+            traceback.print_exc()
+            time.sleep(_POLL_INTERVAL_MS / 1000)
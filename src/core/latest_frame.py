@@ -0,0 +1,63 @@
+# latest_frame.py
+"""最新檢測結果共享緩衝區 - 取代多條結果隊列"""
+
+from __future__ import annotations
+
+import threading
+from typing import List, Sequence, Tuple
+
+import numpy as np
+
+
+class LatestFrame:
+    """保存最新一幀檢測結果的共享緩衝區（單一生產者、多消費者）
+
+    檢測框與置信度以預先配置的 NumPy 陣列 (SoA) 就地寫入，
+    並以 frame_id 標記版本。消費者（覆蓋層、自動開火）各自記錄
+    上次讀取的 frame_id，只在有新結果時複製出來，互不搶奪資料。
+    """
+
+    MAX_DET = 300  # 單幀最多保留的檢測數（與 YOLO 預設 max_det 相同）
+
+    def __init__(self, max_det: int = MAX_DET) -> None:
+        self._max_det = max_det
+        self._boxes = np.zeros((max_det, 4), dtype=np.float32)
+        self._confidences = np.zeros((max_det,), dtype=np.float32)
+        self._n = 0
+        self._frame_id = 0
+        self._lock = threading.Lock()
+
+    def publish(self, boxes: Sequence[Sequence[float]], confidences: Sequence[float]) -> None:
+        """寫入新一幀的檢測結果（超出 max_det 的部分捨棄）
+
+        Args:
+            boxes: 檢測框列表 [[x1, y1, x2, y2], ...]
+            confidences: 與 boxes 對應的置信度列表
+        """
+        n = min(len(boxes), len(confidences), self._max_det)
+        with self._lock:
+            if n:
+                self._boxes[:n] = boxes[:n]
+                self._confidences[:n] = confidences[:n]
+            self._n = n
+            self._frame_id += 1
+
+    def clear(self) -> None:
+        """清空結果；已為空時不遞增版本，避免閒置時消費者重複讀取"""
+        if self._n:
+            self.publish((), ())
+
+    def snapshot(self, since_id: int = -1) -> Tuple[int, List[List[float]], List[float]] | None:
+        """複製出最新結果
+
+        Args:
+            since_id: 消費者上次讀取的 frame_id
+
+        Returns:
+            (frame_id, boxes, confidences)；自 since_id 之後沒有新結果時為 None
+        """
+        if self._frame_id == since_id:
+            return None
+        with self._lock:
+            n = self._n
+            return self._frame_id, self._boxes[:n].tolist(), self._confidences[:n].tolist()
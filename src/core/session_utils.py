@@ -1,10 +1,17 @@
 # session_utils.py
 """ONNX 運行時會話優化模組 - 提供推理性能優化選項"""
 
+import hashlib
 import logging
+import os
+
 import onnxruntime as ort
 
 
+# ORT 優化後模型的快取資料夾名稱（位於項目根目錄）
+ORT_CACHE_DIR_NAME = ".ort_cache"
+
+
 def optimize_onnx_session(config):
     """優化 ONNX 運行時設定
     
@@ -53,3 +60,136 @@ def optimize_onnx_session(config):
         logger.error("ONNX 優化失敗: %s", e)
         return None
 
+
+def get_optimized_model_path(model_path, cache_dir, provider="DML", dim_overrides=()):
+    """計算 ORT 優化後模型的快取路徑
+    
+    快取鍵包含模型絕對路徑、修改時間、onnxruntime 版本、提供者與固定的符號維度，
+    模型更新、onnxruntime 升級或輸入尺寸改變後會自動對應到新的快取檔案。
+    
+    Args:
+        model_path: 原始 .onnx 模型路徑
+        cache_dir: 快取資料夾
+        provider: 執行提供者標記
+        dim_overrides: 會話固定的符號維度 ((名稱, 值), ...)，會被寫入優化後的圖
+        
+    Returns:
+        str: 快取檔案路徑（可能尚未存在）
+    """
+    mtime = os.path.getmtime(model_path)
+    dims = ",".join(f"{name}={value}" for name, value in sorted(dim_overrides))
+    key = f"{os.path.abspath(model_path)}|{mtime}|{ort.__version__}|{provider}|{dims}"
+    digest = hashlib.sha1(key.encode("utf-8")).hexdigest()
+    return os.path.join(cache_dir, digest + ".onnx")
+
+
+# FP16 轉換後 / INT8 量化後模型的副檔名（與原始模型放在同一資料夾）
+FP16_MODEL_SUFFIX = ".fp16.onnx"
+INT8_MODEL_SUFFIX = ".int8.onnx"
+
+# FP16/INT8 模型無法建立會話時寫入的失效標記（<模型檔>.bad）
+BAD_MODEL_SUFFIX = ".bad"
+
+
+def _is_marked_bad(variant_path, reference_path):
+    """失效標記存在且不舊於 reference_path 時回傳 True"""
+    try:
+        return os.path.getmtime(variant_path + BAD_MODEL_SUFFIX) >= os.path.getmtime(reference_path)
+    except OSError:
+        return False
+
+
+def mark_model_variant_bad(variant_path):
+    """標記 FP16/INT8 模型無法建立會話，之後的啟動改用原始 FP32 模型
+    
+    自動轉換的 FP16 模型會一併刪除，原始模型更新後才會重新轉換；
+    INT8 模型為離線產生，只寫入標記，重新量化後即恢復使用。
+    
+    Args:
+        variant_path: 無法載入的 FP16/INT8 模型路徑
+    """
+    logger = logging.getLogger(__name__)
+    try:
+        with open(variant_path + BAD_MODEL_SUFFIX, "w", encoding="utf-8"):
+            pass
+    except OSError as e:
+        logger.warning("無法寫入模型失效標記: %s", e)
+    if variant_path.endswith(FP16_MODEL_SUFFIX):
+        try:
+            os.remove(variant_path)
+        except OSError:
+            pass
+
+
+def get_fp16_model_path(model_path):
+    """取得模型的 FP16 版本，必要時自動轉換
+    
+    DirectML 在一般消費級 GPU 上執行 FP16 核心明顯快於 FP32。轉換時使用
+    keep_io_types=True，模型的輸入/輸出仍為 float32，前處理不需更改。
+    轉換結果存為同資料夾的 <模型名>.fp16.onnx，原始模型較新時會重新轉換；
+    ORT 優化快取以模型路徑與修改時間為鍵，會隨之失效。
+    
+    Args:
+        model_path: 原始 .onnx 模型絕對路徑
+        
+    Returns:
+        str: FP16 模型路徑；缺少 onnx / onnxconverter-common、轉換失敗，
+            或先前的轉換結果已被標記為無法載入時回傳原始路徑
+    """
+    logger = logging.getLogger(__name__)
+    if model_path.endswith((FP16_MODEL_SUFFIX, INT8_MODEL_SUFFIX)):
+        return model_path
+
+    fp16_path = model_path[:-len(".onnx")] + FP16_MODEL_SUFFIX
+    if _is_marked_bad(fp16_path, model_path):
+        return model_path
+    try:
+        if os.path.getmtime(fp16_path) >= os.path.getmtime(model_path):
+            return fp16_path
+    except OSError:
+        pass  # 尚未轉換
+
+    try:
+        import onnx
+        from onnxconverter_common import float16
+    except ImportError:
+        logger.info("未安裝 onnx / onnxconverter-common，使用原始 FP32 模型")
+        return model_path
+
+    temp_path = fp16_path + ".tmp"
+    try:
+        fp16_model = float16.convert_float_to_float16(onnx.load(model_path), keep_io_types=True)
+        onnx.save(fp16_model, temp_path)
+        os.replace(temp_path, fp16_path)
+        logger.info("已轉換 FP16 模型: %s", fp16_path)
+        return fp16_path
+    except Exception as e:
+        logger.warning("FP16 模型轉換失敗，使用原始模型: %s", e)
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+        return model_path
+
+
+def get_int8_model_path(model_path):
+    """取得已量化的 INT8 模型路徑
+    
+    INT8 模型需以 core.quantize_model 搭配遊戲畫面校準集離線產生，
+    這裡只檢查同資料夾的 <模型名>.int8.onnx 是否存在、不舊於原始模型，
+    且未被標記為無法載入。
+    
+    Args:
+        model_path: 原始 .onnx 模型絕對路徑
+        
+    Returns:
+        str: INT8 模型路徑
+        None: 尚未量化、量化結果已過期或已被標記為無法載入時
+    """
+    int8_path = model_path[:-len(".onnx")] + INT8_MODEL_SUFFIX
+    try:
+        if os.path.getmtime(int8_path) >= os.path.getmtime(model_path):
+            return None if _is_marked_bad(int8_path, int8_path) else int8_path
+    except OSError:
+        pass
+    return None
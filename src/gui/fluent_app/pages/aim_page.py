@@ -581,7 +581,7 @@ class AimPage(BasePage):
         self.singleTargetCard.checkedChanged.connect(self._onSingleTargetChanged)
 
         # Arduino 相關信號
-        self.comRefreshBtn.clicked.connect(self._refreshComPorts)
+        self.comRefreshBtn.clicked.connect(lambda: self._refreshComPorts(force_refresh=True))
         self.comPortCombo.currentTextChanged.connect(self._onComPortChanged)
         self.arduinoConnectBtn.clicked.connect(self._onArduinoConnectToggle)
         self.guideBtn.clicked.connect(self._onOpenGuide)
@@ -701,6 +701,9 @@ class AimPage(BasePage):
         if os.path.exists(model_dir):
             models = glob.glob(os.path.join(model_dir, "*.onnx"))
             for m in models:
+                # 自動產生的 FP16 / INT8 版本不列出（載入原始模型時會自動使用）
+                if m.endswith((".fp16.onnx", ".int8.onnx")):
+                    continue
                 self.modelCombo.addItem(os.path.basename(m))
 
     def _openModelFolder(self):
@@ -711,16 +714,15 @@ class AimPage(BasePage):
         if os.path.exists(model_dir):
             os.startfile(model_dir)
 
-    def _refreshComPorts(self):
-        """刷新 COM 埠列表"""
+    def _refreshComPorts(self, force_refresh=False):
+        """刷新 COM 埠列表（短時間內重複呼叫時使用快取，按下刷新按鈕時強制重新列舉）"""
         self.comPortCombo.clear()
         self.comPortCombo.addItem(t("no_com_port"))
 
         try:
-            import serial.tools.list_ports
-            ports = serial.tools.list_ports.comports()
-            for port in ports:
-                self.comPortCombo.addItem(port.device)
+            from win_utils.arduino_mouse import get_available_com_ports
+            for device in get_available_com_ports(force_refresh=force_refresh):
+                self.comPortCombo.addItem(device)
         except ImportError:
             pass
 
@@ -3,7 +3,6 @@
 
 from __future__ import annotations
 
-import queue
 from typing import List, TYPE_CHECKING
 
 from PyQt6.QtWidgets import QApplication, QWidget
@@ -75,10 +74,10 @@ class OverlayColors:
         return QColor(255, 0, 255, 80)
 
 class PyQtOverlay(QWidget):
-    def __init__(self, boxes_queue, confidences_queue, config):
+    def __init__(self, latest_frame, config):
         super().__init__()
-        self.boxes_queue = boxes_queue
-        self.confidences_queue = confidences_queue
+        self.latest_frame = latest_frame
+        self._last_frame_id = -1
         self.config = config
         
         self.setWindowFlags(
@@ -117,30 +116,16 @@ class PyQtOverlay(QWidget):
             print(f"滑鼠穿透設置失敗: {e}")
 
     def update_overlay(self) -> None:
-        """從隊列獲取最新的檢測結果並更新顯示"""
+        """從共享緩衝區獲取最新的檢測結果並更新顯示"""
         desired_interval = max(int(self.config.detect_interval * 1000), 16)
         if desired_interval != self._last_timer_interval_ms:
             self.timer.setInterval(desired_interval)
             self._last_timer_interval_ms = desired_interval
 
-        new_boxes = None
-        new_confidences = None
-        
-        try:
-            new_boxes = self.boxes_queue.get_nowait()
-        except queue.Empty:
-            pass
-            
-        try:
-            new_confidences = self.confidences_queue.get_nowait()
-        except queue.Empty:
-            pass
-        
-        # 更新顯示數據
-        if new_boxes is not None:
-            self.boxes = new_boxes
-        if new_confidences is not None:
-            self.confidences = new_confidences
+        # 更新顯示數據（沒有新一幀時沿用目前的結果）
+        snapshot = self.latest_frame.snapshot(self._last_frame_id)
+        if snapshot is not None:
+            self._last_frame_id, self.boxes, self.confidences = snapshot
             
         # 只在功能啟用時重繪
         if self.config.AimToggle:
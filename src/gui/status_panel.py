@@ -7,13 +7,15 @@ Fluent Design 風格的狀態面板 (Redesigned)
 import os
 import sys
 import ctypes
-from ctypes import POINTER, pointer, sizeof, byref, WinDLL, c_int
+import functools
+from ctypes import POINTER, sizeof, byref, WinDLL, c_int
 from ctypes.wintypes import DWORD, ULONG
 from PyQt6.QtWidgets import (QWidget, QApplication, QVBoxLayout, QHBoxLayout, 
-                             QLabel, QFrame, QGraphicsDropShadowEffect, QSpacerItem, QSizePolicy)
-from PyQt6.QtGui import (QPainter, QColor, QFont, QPixmap, QLinearGradient, 
+                             QLabel, QFrame, QGraphicsScene, QGraphicsPixmapItem,
+                             QGraphicsBlurEffect, QSpacerItem, QSizePolicy)
+from PyQt6.QtGui import (QPainter, QColor, QFont, QPixmap, QImage, QLinearGradient, 
                          QBrush, QPainterPath, QPen)
-from PyQt6.QtCore import Qt, QTimer, QSize, pyqtSignal
+from PyQt6.QtCore import Qt, QTimer, QSize, QRect, QRectF, pyqtSignal
 
 from core.language_manager import get_text, language_manager
 
@@ -61,61 +63,197 @@ class _MARGINS(ctypes.Structure):
 _WCA_ACCENT_POLICY = 19
 _ACCENT_ENABLE_ACRYLICBLURBEHIND = 4
 _ACCENT_DISABLED = 0
+_ACCENT_FLAGS_DRAW_BORDERS = 0x20 | 0x40 | 0x80 | 0x100
+_DWMWA_WINDOW_CORNER_PREFERENCE = DWORD(33)
+_DWMWCP_DONOTROUND = c_int(1)
+_DWMWCP_ROUND = c_int(2)  # 大圓角
+_GLASS_MARGINS = _MARGINS(-1, -1, -1, -1)  # 將 DWM 玻璃框延伸到整個客戶區
+
+# --- 預渲染陰影 (取代 QGraphicsDropShadowEffect 每次重繪的 CPU 模糊) ---
+_SHADOW_BLUR = 20
+_SHADOW_OFFSET_Y = 4
+_SHADOW_COLOR = QColor(0, 0, 0, 60)
+_shadow_tiles_cache = {}  # radius -> (corner, 9 張切片)
+
+# Acrylic 模式 paintEvent 使用的固定顏色
+_CLEAR_COLOR = QColor(0, 0, 0, 0)
+_HIT_TEST_COLOR = QColor(0, 0, 0, 1)
+
+
+def _get_shadow_tiles(radius: int):
+    """取得圓角陰影的 9 宮格切片（每個圓角半徑只渲染一次）
+
+    QGraphicsBlurEffect 需要 QApplication 已建立，因此在第一次繪製時才建立並快取。
+    切片順序: 左上、上、右上、左、中、右、左下、下、右下
+    """
+    cached = _shadow_tiles_cache.get(radius)
+    if cached is not None:
+        return cached
+
+    pad = _SHADOW_BLUR
+    core = radius * 2 + 2
+    size = core + pad * 2
+
+    # 1. 繪製實心圓角矩形
+    source = QImage(size, size, QImage.Format.Format_ARGB32_Premultiplied)
+    source.fill(Qt.GlobalColor.transparent)
+    painter = QPainter(source)
+    painter.setRenderHint(QPainter.RenderHint.Antialiasing, True)
+    painter.setPen(Qt.PenStyle.NoPen)
+    painter.setBrush(_SHADOW_COLOR)
+    painter.drawRoundedRect(QRectF(pad, pad, core, core), radius, radius)
+    painter.end()
+
+    # 2. 透過離屏 QGraphicsScene 套用一次性模糊
+    scene = QGraphicsScene()
+    item = QGraphicsPixmapItem(QPixmap.fromImage(source))
+    blur = QGraphicsBlurEffect()
+    blur.setBlurRadius(_SHADOW_BLUR)
+    item.setGraphicsEffect(blur)
+    scene.addItem(item)
+
+    blurred = QImage(size, size, QImage.Format.Format_ARGB32_Premultiplied)
+    blurred.fill(Qt.GlobalColor.transparent)
+    painter = QPainter(blurred)
+    area = QRectF(0, 0, size, size)
+    scene.render(painter, area, area)
+    painter.end()
+
+    # 3. 切成 9 宮格
+    pixmap = QPixmap.fromImage(blurred)
+    corner = pad + radius
+    mid = size - corner * 2
+    offsets = ((0, corner), (corner, mid), (corner + mid, corner))
+    tiles = tuple(
+        pixmap.copy(x, y, w, h)
+        for y, h in offsets
+        for x, w in offsets
+    )
+    cached = (corner, tiles)
+    _shadow_tiles_cache[radius] = cached
+    return cached
+
 
 # --- Fluent Design 顏色方案 ---
+def _theme_qcolor(pair, is_dark: bool) -> QColor:
+    """依指定主題取出 ThemeColors 顏色對 (HEX 或 RGBA) 並轉為 QColor"""
+    value = pair.dark if is_dark else pair.light
+    if isinstance(value, str):
+        return QColor(value)
+    return QColor(*value)
+
+
+# 每個顏色依主題 (深/淺) 各快取一個 QColor，回傳的是共用實例，請勿直接修改
+@functools.lru_cache(maxsize=2)
+def _background_color(is_dark: bool) -> QColor:
+    if HAS_THEME_COLORS:
+        return _theme_qcolor(ThemeColors.PANEL_BACKGROUND, is_dark)
+    if is_dark:
+        return QColor(30, 30, 30, 255)  # 深色主題背景
+    else:
+        return QColor(255, 255, 255, 255)  # 亮色主題背景
+
+
+@functools.lru_cache(maxsize=2)
+def _text_primary_color(is_dark: bool) -> QColor:
+    if HAS_THEME_COLORS:
+        return _theme_qcolor(ThemeColors.TEXT_PRIMARY, is_dark)
+    return QColor(255, 255, 255) if is_dark else QColor(26, 26, 26)
+
+
+@functools.lru_cache(maxsize=2)
+def _text_secondary_color(is_dark: bool) -> QColor:
+    if HAS_THEME_COLORS:
+        return _theme_qcolor(ThemeColors.TEXT_SECONDARY, is_dark)
+    return QColor(160, 160, 160) if is_dark else QColor(90, 90, 90)
+
+
+@functools.lru_cache(maxsize=2)
+def _border_color(is_dark: bool) -> QColor:
+    if HAS_THEME_COLORS:
+        return _theme_qcolor(ThemeColors.PANEL_BORDER, is_dark)
+    return QColor(255, 255, 255, 20) if is_dark else QColor(0, 0, 0, 15)
+
+
+@functools.lru_cache(maxsize=2)
+def _accent_color(is_dark: bool) -> QColor:
+    if HAS_THEME_COLORS:
+        return _theme_qcolor(ThemeColors.ACCENT, is_dark)
+    return QColor(0, 122, 255)  # macOS Blue
+
+
+@functools.lru_cache(maxsize=2)
+def _success_color(is_dark: bool) -> QColor:
+    if HAS_THEME_COLORS:
+        return _theme_qcolor(ThemeColors.SUCCESS, is_dark)
+    return QColor(52, 199, 89) if not is_dark else QColor(50, 215, 75)
+
+
+@functools.lru_cache(maxsize=2)
+def _error_color(is_dark: bool) -> QColor:
+    if HAS_THEME_COLORS:
+        return _theme_qcolor(ThemeColors.ERROR, is_dark)
+    return QColor(255, 59, 48) if not is_dark else QColor(255, 69, 58)
+
+
+@functools.lru_cache(maxsize=64)
+def _rgba_str(rgba: int) -> str:
+    """將 QColor.rgba() (0xAARRGGBB) 轉為 CSS rgba() 字串，依數值快取"""
+    return (f"rgba({(rgba >> 16) & 0xFF}, {(rgba >> 8) & 0xFF}, {rgba & 0xFF}, "
+            f"{((rgba >> 24) & 0xFF) / 255.0})")
+
+
+_COLOR_CACHES = (
+    _background_color, _text_primary_color, _text_secondary_color,
+    _border_color, _accent_color, _success_color, _error_color,
+)
+
+
 class FluentColors:
     """Fluent Design 配色方案 - 支持深色/淺色主題
     現已整合 ThemeColors 模組的統一顏色定義
+    顏色依主題快取，主題切換時呼叫 invalidate_cache()
     """
     
     @staticmethod
     def to_css_rgba(color: QColor) -> str:
-        return f"rgba({color.red()}, {color.green()}, {color.blue()}, {color.alpha() / 255.0})"
+        return _rgba_str(color.rgba())
 
     @staticmethod
     def get_background_color():
-        if HAS_THEME_COLORS:
-            return ThemeColors.PANEL_BACKGROUND.qcolor()
-        if isDarkTheme():
-            return QColor(30, 30, 30, 255)  # 深色主題背景
-        else:
-            return QColor(255, 255, 255, 255)  # 亮色主題背景
+        return _background_color(isDarkTheme())
 
     @staticmethod
     def get_text_primary_color():
-        if HAS_THEME_COLORS:
-            return ThemeColors.TEXT_PRIMARY.qcolor()
-        return QColor(255, 255, 255) if isDarkTheme() else QColor(26, 26, 26)
+        return _text_primary_color(isDarkTheme())
         
     @staticmethod
     def get_text_secondary_color():
-        if HAS_THEME_COLORS:
-            return ThemeColors.TEXT_SECONDARY.qcolor()
-        return QColor(160, 160, 160) if isDarkTheme() else QColor(90, 90, 90)
+        return _text_secondary_color(isDarkTheme())
 
     @staticmethod
     def get_border_color():
-        if HAS_THEME_COLORS:
-            return ThemeColors.PANEL_BORDER.qcolor()
-        return QColor(255, 255, 255, 20) if isDarkTheme() else QColor(0, 0, 0, 15)
+        return _border_color(isDarkTheme())
 
     @staticmethod
     def get_accent_color():
-        if HAS_THEME_COLORS:
-            return ThemeColors.ACCENT.qcolor()
-        return QColor(0, 122, 255)  # macOS Blue
+        return _accent_color(isDarkTheme())
     
     @staticmethod
     def get_success_color():
-        if HAS_THEME_COLORS:
-            return ThemeColors.SUCCESS.qcolor()
-        return QColor(52, 199, 89) if not isDarkTheme() else QColor(50, 215, 75)
+        return _success_color(isDarkTheme())
     
     @staticmethod
     def get_error_color():
-        if HAS_THEME_COLORS:
-            return ThemeColors.ERROR.qcolor()
-        return QColor(255, 59, 48) if not isDarkTheme() else QColor(255, 69, 58)
+        return _error_color(isDarkTheme())
+
+    @staticmethod
+    def invalidate_cache():
+        """清除所有顏色快取，並更新向後兼容的 SUCCESS / ERROR 屬性"""
+        for cache in _COLOR_CACHES:
+            cache.cache_clear()
+        FluentColors.SUCCESS = FluentColors.get_success_color()
+        FluentColors.ERROR = FluentColors.get_error_color()
          
     # 保持向後兼容的靜態屬性
     @property
@@ -131,6 +269,18 @@ _fluent_colors_instance = FluentColors()
 FluentColors.SUCCESS = _fluent_colors_instance.get_success_color()
 FluentColors.ERROR = _fluent_colors_instance.get_error_color()
 
+def _maybe_set_text(label: QLabel, text: str):
+    """僅在文字實際改變時呼叫 setText，避免多餘的屬性通知與版面重算"""
+    if label.text() != text:
+        label.setText(text)
+
+
+def _maybe_set_style(widget: QWidget, style: str):
+    """僅在樣式實際改變時呼叫 setStyleSheet，避免重新解析 QSS"""
+    if widget.styleSheet() != style:
+        widget.setStyleSheet(style)
+
+
 class StatusIndicator(QWidget):
     """一個簡單的圓點狀態指示器"""
     def __init__(self, parent=None):
@@ -174,9 +324,9 @@ class StatusRow(QWidget):
         layout.addWidget(self.value_label)
 
     def set_value(self, text, color=None):
-        self.value_label.setText(text)
+        _maybe_set_text(self.value_label, text)
         if color:
-            self.value_label.setStyleSheet(f"color: {color};")
+            _maybe_set_style(self.value_label, f"color: {color};")
         else:
             # 重置為預設樣式
             pass
@@ -192,13 +342,26 @@ class StatusPanel(QWidget):
     ACRYLIC_PANEL_WIDTH = 0
     ACRYLIC_PANEL_HEIGHT = 0
     BORDER_RADIUS = 24 # MacOS rounded corners
+    # update_display 使用的翻譯鍵，僅在語言切換時重新查詢
+    _TEXT_KEYS = ('auto_aim', 'status_panel_current_model', 'mouse_move_method',
+                  'status_panel_on', 'status_panel_off')
 
     def __init__(self, config):
         super().__init__()
         self.setObjectName("statusPanelRoot")
         self.config = config
         self._acrylic_enabled = False  # 追蹤 Acrylic 是否已成功啟用
-        self._shadow_effect = None     # 追蹤陰影特效實例
+        self._shadow_enabled = False   # 非 Acrylic 模式下是否繪製預渲染陰影
+        self._cached_clip_path = QPainterPath()  # Acrylic 模式圓角路徑，於 resizeEvent 更新
+
+        # Acrylic Accent Policy 結構體（重複使用，僅修改欄位）
+        # _wincompattr.Data 固定指向 _accent_policy，之後只需修改欄位並以 byref 傳入
+        self._accent_policy = _ACCENT_POLICY()
+        self._wincompattr = _WINCOMPATTRDATA(
+            _WCA_ACCENT_POLICY,
+            ctypes.cast(ctypes.addressof(self._accent_policy), POINTER(_ACCENT_POLICY)),
+            sizeof(_ACCENT_POLICY),
+        )
         
         # --- 視窗基本設定 ---
         self.setWindowFlags(
@@ -229,6 +392,7 @@ class StatusPanel(QWidget):
         self.last_model_path = None
         self.last_mouse_method = None
         self.last_language = None
+        self._cached_texts = {}            # 翻譯鍵 -> 當前語言的文字
         self._last_acrylic_enabled = None  # 追蹤 config 的 acrylic 開關
         self._last_acrylic_alpha = None    # 追蹤 acrylic 不透明度
 
@@ -247,15 +411,28 @@ class StatusPanel(QWidget):
     def showEvent(self, event):
         """視窗顯示時套用 Acrylic 效果和圓角"""
         super().showEvent(event)
-        # 延遲套用，確保 HWND 已完全建立
-        QTimer.singleShot(150, self._applyAcrylicEffect)
-        QTimer.singleShot(200, self._applyWindowRoundedCorners)
+        # 延遲套用，確保 HWND 已完全建立（單一計時器依序完成兩項 DWM 設定）
+        QTimer.singleShot(100, self._post_show_setup)
+
+    def _post_show_setup(self):
+        """顯示後的 Win32 設定：Acrylic 效果與視窗圓角"""
+        self._applyAcrylicEffect()
+        self._applyWindowRoundedCorners()
 
     def resizeEvent(self, event):
-        """視窗大小改變時重新套用圓角 region (Win10 fallback)"""
+        """視窗大小改變時重新套用圓角 region (Win10 fallback) 並更新圓角路徑快取"""
         super().resizeEvent(event)
+        self._update_clip_path()
         self._applyWindowRoundedCorners()
 
+    def _update_clip_path(self):
+        """重新計算 Acrylic 模式的圓角客戶區路徑"""
+        path = QPainterPath()
+        rect = self.rect().adjusted(0, 0, -1, -1)
+        path.addRoundedRect(float(rect.x()), float(rect.y()), float(rect.width()), float(rect.height()),
+                            float(self.BORDER_RADIUS), float(self.BORDER_RADIUS))
+        self._cached_clip_path = path
+
     def _applyWindowRoundedCorners(self):
         """設定視窗圓角
         
@@ -272,12 +449,9 @@ class StatusPanel(QWidget):
             
             # 嘗試 Win11 DWM 圓角設定
             try:
-                DWMWA_WINDOW_CORNER_PREFERENCE = 33
-                DWMWCP_DONOTROUND = c_int(1)
-                DWMWCP_ROUND = c_int(2)  # 大圓角
-                corner_pref = DWMWCP_ROUND if self._acrylic_enabled else DWMWCP_DONOTROUND
+                corner_pref = _DWMWCP_ROUND if self._acrylic_enabled else _DWMWCP_DONOTROUND
                 dwmapi.DwmSetWindowAttribute(
-                    hwnd, DWORD(DWMWA_WINDOW_CORNER_PREFERENCE),
+                    hwnd, _DWMWA_WINDOW_CORNER_PREFERENCE,
                     byref(corner_pref), 4
                 )
             except Exception:
@@ -318,11 +492,8 @@ class StatusPanel(QWidget):
             user32 = WinDLL("user32")
             dwmapi = WinDLL("dwmapi")
 
-            accentPolicy = _ACCENT_POLICY()
-            winCompAttrData = _WINCOMPATTRDATA()
-            winCompAttrData.Attribute = _WCA_ACCENT_POLICY
-            winCompAttrData.SizeOfData = sizeof(accentPolicy)
-            winCompAttrData.Data = pointer(accentPolicy)
+            accentPolicy = self._accent_policy
+            winCompAttrData = self._wincompattr
 
             if not enable:
                 # 停用 Acrylic - 恢復到普通模式
@@ -330,7 +501,7 @@ class StatusPanel(QWidget):
                 accentPolicy.GradientColor = 0
                 accentPolicy.AccentFlags = 0
                 accentPolicy.AnimationId = 0
-                user32.SetWindowCompositionAttribute(hwnd, pointer(winCompAttrData))
+                user32.SetWindowCompositionAttribute(hwnd, byref(winCompAttrData))
                 
                 # 恢復 WA_TranslucentBackground 用於圓角透明
                 self.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground, True)
@@ -352,42 +523,27 @@ class StatusPanel(QWidget):
             self.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground, False)
             
             # 步驟 2: 將 DWM 玻璃框延伸到整個客戶區
-            margins = _MARGINS(-1, -1, -1, -1)
-            dwmapi.DwmExtendFrameIntoClientArea(hwnd, byref(margins))
+            dwmapi.DwmExtendFrameIntoClientArea(hwnd, byref(_GLASS_MARGINS))
             
             # 步驟 3: 嘗試設定 Win11 圓角 (DWMWA_WINDOW_CORNER_PREFERENCE = 33)
             try:
-                DWMWA_WINDOW_CORNER_PREFERENCE = 33
-                DWMWCP_ROUND = c_int(2)  # 圓角
                 dwmapi.DwmSetWindowAttribute(
-                    hwnd, DWORD(DWMWA_WINDOW_CORNER_PREFERENCE),
-                    byref(DWMWCP_ROUND), sizeof(DWMWCP_ROUND)
+                    hwnd, _DWMWA_WINDOW_CORNER_PREFERENCE,
+                    byref(_DWMWCP_ROUND), sizeof(_DWMWCP_ROUND)
                 )
             except Exception:
                 pass  # Win10 不支援，忽略
 
             # 步驟 4: 計算 gradientColor
-            raw_alpha = getattr(self.config, 'acrylic_window_alpha', 187)
-            alpha = max(0, min(255, int(raw_alpha)))
-            alpha_hex = hex(alpha)[2:].upper().zfill(2)
-
-            is_dark = isDarkTheme()
-            if is_dark:
-                gradient_str = f"1A1A1A{alpha_hex}"
-            else:
-                gradient_str = f"F5F5F5{alpha_hex}"
-
-            # 轉換 RRGGBBAA -> AABBGGRR (Win32 byte order)
-            gradient_reversed = ''.join(gradient_str[i:i+2] for i in range(6, -1, -2))
-            gradient_color = DWORD(int(gradient_reversed, base=16))
+            gradient_color = self._acrylic_gradient_color()
 
             # 步驟 5: 套用 Acrylic Accent Policy
             accentPolicy.AccentState = _ACCENT_ENABLE_ACRYLICBLURBEHIND
             accentPolicy.GradientColor = gradient_color
-            accentPolicy.AccentFlags = DWORD(0x20 | 0x40 | 0x80 | 0x100)  # 啟用陰影邊框
-            accentPolicy.AnimationId = DWORD(0)
+            accentPolicy.AccentFlags = _ACCENT_FLAGS_DRAW_BORDERS  # 啟用陰影邊框
+            accentPolicy.AnimationId = 0
 
-            user32.SetWindowCompositionAttribute(hwnd, pointer(winCompAttrData))
+            user32.SetWindowCompositionAttribute(hwnd, byref(winCompAttrData))
             self._acrylic_enabled = True
             
             # Acrylic 模式不需要 Qt 層面的陰影和邊距
@@ -404,20 +560,62 @@ class StatusPanel(QWidget):
             # 失敗時恢復 WA_TranslucentBackground
             self.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground, True)
 
+    def _acrylic_gradient_color(self) -> int:
+        """依主題與 acrylic_window_alpha 計算 GradientColor (Win32 AABBGGRR)"""
+        raw_alpha = getattr(self.config, 'acrylic_window_alpha', 187)
+        alpha = max(0, min(255, int(raw_alpha)))
+        # 深色 1A1A1A / 淺色 F5F5F5，灰階色的 BGR 與 RGB 相同
+        gray = 0x1A if isDarkTheme() else 0xF5
+        return (alpha << 24) | (gray << 16) | (gray << 8) | gray
+
+    def _applyAcrylicAlpha(self):
+        """快速路徑：僅更新 Acrylic 不透明度
+        
+        只修改 GradientColor 並重新呼叫 SetWindowCompositionAttribute，
+        不重做 DwmExtendFrameIntoClientArea、樣式表與 SetWindowRgn。
+        """
+        if sys.platform != 'win32' or not self._acrylic_enabled:
+            return
+        try:
+            hwnd = int(self.winId())
+            if hwnd == 0:
+                return
+            self._accent_policy.GradientColor = self._acrylic_gradient_color()
+            WinDLL("user32").SetWindowCompositionAttribute(hwnd, byref(self._wincompattr))
+        except Exception as e:
+            print(f"[StatusPanel] 更新 Acrylic 不透明度失敗: {e}")
+
     def _applyShadowEffect(self):
-        """套用 Qt 陰影特效（非 Acrylic 模式使用）"""
-        if self._shadow_effect is None:
-            shadow = QGraphicsDropShadowEffect(self)
-            shadow.setBlurRadius(20)
-            shadow.setColor(QColor(0, 0, 0, 60))
-            shadow.setOffset(0, 4)
-            self.container.setGraphicsEffect(shadow)
-            self._shadow_effect = shadow
+        """啟用預渲染陰影（非 Acrylic 模式使用）"""
+        if not self._shadow_enabled:
+            self._shadow_enabled = True
+            self.update()
 
     def _removeShadowEffect(self):
-        """移除 Qt 陰影特效（Acrylic 模式下 DWM 提供陰影）"""
-        self.container.setGraphicsEffect(None)
-        self._shadow_effect = None
+        """停用預渲染陰影（Acrylic 模式下 DWM 提供陰影）"""
+        if self._shadow_enabled:
+            self._shadow_enabled = False
+            self.update()
+
+    def _paintShadow(self, painter):
+        """以 9 宮格貼圖在容器下方繪製陰影（四角原尺寸、四邊與中心拉伸）"""
+        corner, tiles = _get_shadow_tiles(self.BORDER_RADIUS)
+        pad = _SHADOW_BLUR
+        target = self.container.geometry().translated(0, _SHADOW_OFFSET_Y).adjusted(-pad, -pad, pad, pad)
+        mid_w = target.width() - corner * 2
+        mid_h = target.height() - corner * 2
+        if mid_w < 0 or mid_h < 0:
+            return
+
+        left, top = target.x(), target.y()
+        xs = ((left, corner), (left + corner, mid_w), (left + corner + mid_w, corner))
+        ys = ((top, corner), (top + corner, mid_h), (top + corner + mid_h, corner))
+        index = 0
+        for y, h in ys:
+            for x, w in xs:
+                if w > 0 and h > 0:
+                    painter.drawPixmap(QRect(x, y, w, h), tiles[index])
+                index += 1
 
     def paintEvent(self, event):
         """自訂繪製 - Acrylic 模式下清除背景讓 DWM 毛玻璃透出"""
@@ -427,20 +625,20 @@ class StatusPanel(QWidget):
             painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_Source)
 
             # 先清空整個區域，再僅填入圓角客戶區，避免 Acrylic 呈現方角
-            painter.fillRect(self.rect(), QColor(0, 0, 0, 0))
+            painter.fillRect(self.rect(), _CLEAR_COLOR)
 
             painter.setRenderHint(QPainter.RenderHint.Antialiasing, True)
-            path = QPainterPath()
-            rect = self.rect().adjusted(0, 0, -1, -1)
-            path.addRoundedRect(float(rect.x()), float(rect.y()), float(rect.width()), float(rect.height()),
-                                float(self.BORDER_RADIUS), float(self.BORDER_RADIUS))
 
             # 使用 alpha=1 而非 alpha=0：
             # alpha=0 可能讓 DWM 將區域視為玻璃框，拖動事件被攔截
-            painter.fillPath(path, QColor(0, 0, 0, 1))
+            painter.fillPath(self._cached_clip_path, _HIT_TEST_COLOR)
             painter.end()
         else:
-            # 非 Acrylic 模式：使用預設繪製（WA_TranslucentBackground 處理透明）
+            # 非 Acrylic 模式：WA_TranslucentBackground 處理透明，容器下方貼上預渲染陰影
+            if self._shadow_enabled:
+                painter = QPainter(self)
+                self._paintShadow(painter)
+                painter.end()
             super().paintEvent(event)
 
     def _init_ui(self):
@@ -453,7 +651,7 @@ class StatusPanel(QWidget):
         self.container = QFrame(self)
         self.container.setObjectName("container")
         
-        # Shadow Effect（預設啟用，Acrylic 啟用時會移除）
+        # 預渲染陰影（預設啟用，Acrylic 啟用時會移除）
         self._applyShadowEffect()
 
         self.container_layout = QVBoxLayout(self.container)
@@ -625,6 +823,7 @@ class StatusPanel(QWidget):
         current_theme_dark = isDarkTheme()
         if current_theme_dark != self.last_theme_dark:
             self.last_theme_dark = current_theme_dark
+            FluentColors.invalidate_cache()
             self._update_style()
             self._load_logo()
             # 主題變化時重新套用 Acrylic（更新毛玻璃顏色）
@@ -633,12 +832,15 @@ class StatusPanel(QWidget):
         # 2.5 檢查 Acrylic 開關或不透明度變化
         current_acrylic = getattr(self.config, 'enable_acrylic', True)
         current_alpha = getattr(self.config, 'acrylic_window_alpha', 187)
-        acrylic_changed = (current_acrylic != self._last_acrylic_enabled or
-                           current_alpha != self._last_acrylic_alpha)
-        if acrylic_changed:
+        if current_acrylic != self._last_acrylic_enabled:
+            # 開關切換：完整重新套用
             self._last_acrylic_enabled = current_acrylic
             self._last_acrylic_alpha = current_alpha
             self._applyAcrylicEffect()
+        elif current_alpha != self._last_acrylic_alpha:
+            # 僅不透明度改變（例如拖動滑桿）：只更新 GradientColor
+            self._last_acrylic_alpha = current_alpha
+            self._applyAcrylicAlpha()
 
         # 3. 獲取數據
         current_aim = self.config.AimToggle
@@ -646,24 +848,27 @@ class StatusPanel(QWidget):
         current_method = getattr(self.config, 'mouse_move_method', 'ddxoft')
         current_lang = language_manager.get_current_language()
 
-        # 檢查是否需要更新 UI 文本 (例如語言改變或狀態改變)
-        # 為了簡化，簡單比較關鍵值，或者直接更新所有文字(開銷很小)
-        
+        # 語言改變時才重新查詢翻譯文字
+        if current_lang != self.last_language:
+            self.last_language = current_lang
+            self._cached_texts = {key: get_text(key) for key in self._TEXT_KEYS}
+        texts = self._cached_texts
+
         # 更新 Auto Aim
         if current_aim:
-            self.aim_status_label.setText(get_text("status_panel_on"))
-            self.aim_status_label.setStyleSheet(f"color: {FluentColors.to_css_rgba(FluentColors.SUCCESS)};")
+            _maybe_set_text(self.aim_status_label, texts['status_panel_on'])
+            _maybe_set_style(self.aim_status_label, f"color: {FluentColors.to_css_rgba(FluentColors.SUCCESS)};")
             self.aim_indicator.set_status(True)
         else:
-            self.aim_status_label.setText(get_text("status_panel_off"))
-            self.aim_status_label.setStyleSheet(f"color: {FluentColors.to_css_rgba(FluentColors.ERROR)};")
+            _maybe_set_text(self.aim_status_label, texts['status_panel_off'])
+            _maybe_set_style(self.aim_status_label, f"color: {FluentColors.to_css_rgba(FluentColors.ERROR)};")
             self.aim_indicator.set_status(False)
-        self.aim_text_label.setText(get_text('auto_aim'))
+        _maybe_set_text(self.aim_text_label, texts['auto_aim'])
 
         # 更新 Model
         model_name = os.path.basename(current_model) if current_model else "None"
         if len(model_name) > 25: model_name = model_name[:22] + "..."
-        self.model_row.label.setText(get_text('status_panel_current_model'))
+        _maybe_set_text(self.model_row.label, texts['status_panel_current_model'])
         self.model_row.set_value(model_name)
 
         # 更新 Mouse Method
@@ -696,7 +901,7 @@ class StatusPanel(QWidget):
                 disp_method += " ✗"
                 method_color = FluentColors.to_css_rgba(FluentColors.ERROR)
         
-        self.mouse_row.label.setText(get_text('mouse_move_method'))
+        _maybe_set_text(self.mouse_row.label, texts['mouse_move_method'])
         self.mouse_row.set_value(disp_method, method_color)
 
     # --- 拖動邏輯 ---
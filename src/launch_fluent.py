@@ -1,6 +1,7 @@
 
 import sys
 import os
+from concurrent.futures import ThreadPoolExecutor
 
 # Ensure src and dependencies are in path
 _src_dir = os.path.dirname(os.path.abspath(__file__))
@@ -16,17 +17,25 @@ from core.config_manager import ConfigManager
 _CONFIG_PATH = 'config.json'
 
 def main():
-    app = QApplication(sys.argv)
-
     # ── 判斷是否為全新安裝（config.json 尚未存在）──
     is_first_run = not os.path.exists(_CONFIG_PATH)
 
     # 初始化配置
     config = Config()
-    load_config(config)
 
-    # ── 首次啟動：顯示設置精靈 ──────────────────────
-    if is_first_run:
+    # 非首次啟動：在背景執行緒讀取設定檔與配置目錄，與 QApplication 初始化並行
+    if not is_first_run:
+        with ThreadPoolExecutor(max_workers=2, thread_name_prefix="startup") as executor:
+            config_future = executor.submit(load_config, config)
+            manager_future = executor.submit(ConfigManager)
+            app = QApplication(sys.argv)
+            config_future.result()
+            cfg_manager = manager_future.result()
+    else:
+        app = QApplication(sys.argv)
+        load_config(config)
+
+        # ── 首次啟動：顯示設置精靈 ──────────────────────
         from gui.fluent_app.setup_wizard import SetupWizard
         wizard = SetupWizard(config)
         result = wizard.exec()
@@ -34,8 +43,8 @@ def main():
         wizard.applyChosenTheme()
         save_config(config)
 
-    # 初始化配置管理器
-    cfg_manager = ConfigManager()
+        # 初始化配置管理器
+        cfg_manager = ConfigManager()
 
     # 建立視窗並注入配置（setConfig 會自動套用已保存的主題設定）
     window = AxiomWindow()
@@ -31,46 +31,68 @@ if sys.platform == "win32":
             except (AttributeError, OSError):
                 pass  # DPI awareness 設置失敗，使用系統預設
 
-# 將 src 目錄添加到 Python 路徑，以便導入同目錄下的模組
+# 將 src、dependencies (位於 src/python/dependencies) 與 pywin32 目錄添加到 Python 路徑
 src_dir = os.path.dirname(os.path.abspath(__file__))
-if src_dir not in sys.path:
-    sys.path.insert(0, src_dir)
-
-# 將 dependencies 目錄添加到 Python 路徑 (位於 src/python/dependencies)
 python_dir = os.path.join(src_dir, "python")
 dependencies_dir = os.path.join(python_dir, "dependencies")
-if dependencies_dir not in sys.path:
-    sys.path.insert(0, dependencies_dir)
-
-# 為 pywin32 添加額外的路徑
 win32_dir = os.path.join(dependencies_dir, "win32")
 win32_lib_dir = os.path.join(win32_dir, "lib")
-if win32_dir not in sys.path:
-    sys.path.insert(0, win32_dir)
-if win32_lib_dir not in sys.path:
-    sys.path.insert(0, win32_lib_dir)
 
-# 確保能找到 dependencies 目錄下的 DLL (如 pythoncom311.dll)
+# 單次去重後一併插入到最前面（優先順序：win32/lib > win32 > dependencies > src）
+_seen_paths = set(sys.path)
+sys.path[:0] = [
+    p for p in (win32_lib_dir, win32_dir, dependencies_dir, src_dir)
+    if p not in _seen_paths
+]
+del _seen_paths
+
 if sys.platform == "win32":
-    os.environ["PATH"] = f"{dependencies_dir};{os.environ.get('PATH', '')}"
-    try:
-        os.add_dll_directory(dependencies_dir)
-    except (AttributeError, OSError):
-        pass
+    import atexit
+    import contextlib
+
+    # add_dll_directory 回傳的句柄關閉後該資料夾即移出搜尋路徑，統一保存並於結束時關閉
+    _DLL_DIR_HANDLES = contextlib.ExitStack()
+    atexit.register(_DLL_DIR_HANDLES.close)
+
+    def _add_dll_dir(path: str):
+        """將資料夾加入 DLL 搜尋路徑，回傳句柄；資料夾不存在或改用 PATH 時為 None"""
+        if not path:
+            return None
+        try:
+            handle = os.add_dll_directory(path)
+        except AttributeError:
+            # Python 3.8 之前沒有 add_dll_directory，只能修改 PATH
+            os.environ["PATH"] = os.pathsep.join([path, os.environ.get("PATH", "")])
+            return None
+        except OSError:
+            return None
+        return _DLL_DIR_HANDLES.enter_context(handle)
+
+    # 確保能找到 dependencies 目錄下的 DLL (如 pythoncom311.dll)
+    _add_dll_dir(dependencies_dir)
     
     # 嘗試手動預加載 pywin32 的 DLL，解決 ImportError
     import ctypes
-    import glob
     try:
-        # 尋找並加載 pywintypesXXX.dll
-        pywintypes_dlls = glob.glob(os.path.join(dependencies_dir, "pywintypes*.dll"))
-        if pywintypes_dlls:
-            ctypes.WinDLL(pywintypes_dlls[0])
-            
-        # 尋找並加載 pythoncomXXX.dll
-        pythoncom_dlls = glob.glob(os.path.join(dependencies_dir, "pythoncom*.dll"))
-        if pythoncom_dlls:
-            ctypes.WinDLL(pythoncom_dlls[0])
+        # 單次掃描目錄，尋找 pywintypesXXX.dll 與 pythoncomXXX.dll（依名稱排序確保結果穩定）
+        _preload_dlls = {"pywintypes": None, "pythoncom": None}
+        if os.path.isdir(dependencies_dir):
+            with os.scandir(dependencies_dir) as entries:
+                for entry in sorted(entries, key=lambda e: e.name):
+                    name = entry.name.lower()
+                    if not name.endswith(".dll"):
+                        continue
+                    for prefix, found in _preload_dlls.items():
+                        if found is None and name.startswith(prefix):
+                            _preload_dlls[prefix] = entry.path
+                            break
+                    if all(_preload_dlls.values()):
+                        break
+
+        # pywintypes 必須先於 pythoncom 加載
+        for dll_path in _preload_dlls.values():
+            if dll_path:
+                ctypes.WinDLL(dll_path)
     except Exception as e:
         print(f"Warning: Failed to preload pywin32 DLLs: {e}")
 
@@ -86,97 +108,181 @@ logger.info(f"Axiom v{__version__} Starting...")
 project_root = os.path.dirname(src_dir)
 
 import threading
-import queue
-from typing import Optional
+import time
+from concurrent.futures import Future
+from typing import Optional, TYPE_CHECKING
 
-# 初始化 pywin32 - 必須先導入 pywintypes
-import pywintypes
-import onnxruntime as ort
+# onnxruntime / pywin32 / PyQt6 等重量級模組延遲到實際使用時才導入，
+# 縮短啟動（以及管理員權限重新啟動）時的導入時間
+if TYPE_CHECKING:
+    import onnxruntime as ort
+    from core.latest_frame import LatestFrame
 
 # When bundled with PyInstaller, ensure native dependencies are discoverable.
-_DLL_DIR_HANDLES = []
-if sys.platform == "win32":
-    def _maybe_add_dll_dir(path: str):
-        if not path:
-            return
-        try:
-            handle = os.add_dll_directory(path)
-            _DLL_DIR_HANDLES.append(handle)
-        except AttributeError:
-            os.environ["PATH"] = f"{path};{os.environ.get('PATH', '')}"
-        except (FileNotFoundError, NotADirectoryError):
-            pass
-
-    if getattr(sys, "frozen", False):
-        base_dir = getattr(sys, '_MEIPASS', '')
-        search_roots = [
-            base_dir,
-            os.path.join(base_dir, 'onnxruntime'),
-            os.path.join(base_dir, 'onnxruntime', 'capi'),
-        ]
-        for candidate in search_roots:
-            if candidate and os.path.isdir(candidate):
-                _maybe_add_dll_dir(candidate)
-
-        exe_dir = os.path.dirname(sys.executable)
-        fallback_dirs = [
-            os.path.join(exe_dir, 'onnxruntime'),
-            os.path.join(exe_dir, 'onnxruntime', 'capi'),
-        ]
-        for candidate in fallback_dirs:
-            if os.path.isdir(candidate):
-                _maybe_add_dll_dir(candidate)
-
-# 從我們自己建立的模組中導入
+if sys.platform == "win32" and getattr(sys, "frozen", False):
+    base_dir = getattr(sys, '_MEIPASS', '')
+    search_roots = [
+        base_dir,
+        os.path.join(base_dir, 'onnxruntime'),
+        os.path.join(base_dir, 'onnxruntime', 'capi'),
+    ]
+    for candidate in search_roots:
+        if candidate and os.path.isdir(candidate):
+            _add_dll_dir(candidate)
+
+    exe_dir = os.path.dirname(sys.executable)
+    fallback_dirs = [
+        os.path.join(exe_dir, 'onnxruntime'),
+        os.path.join(exe_dir, 'onnxruntime', 'capi'),
+    ]
+    for candidate in fallback_dirs:
+        if os.path.isdir(candidate):
+            _add_dll_dir(candidate)
+
+# 從我們自己建立的模組中導入（僅標準庫依賴的模組；其餘於函數內延遲導入）
 from core.config import Config, load_config, save_config
-from win_utils import check_and_request_admin, test_ddxoft_functions, ensure_ddxoft_ready
-from core.session_utils import optimize_onnx_session
-from core.ai_loop import ai_logic_loop
-from core.auto_fire import auto_fire_loop
-from core.key_listener import aim_toggle_key_listener
-from gui.overlay import PyQtOverlay
 
-from gui.status_panel import StatusPanel
-from gui.disclaimer_dialog import DisclaimerDialog
+
+def _ensure_pywin32() -> None:
+    """初始化 pywin32 - 必須在導入任何使用 win32api 的模組前先導入 pywintypes"""
+    import pywintypes  # noqa: F401
 
 
 # 全域變數宣告
 ai_thread: Optional[threading.Thread] = None
 auto_fire_thread: Optional[threading.Thread] = None
 
-def start_ai_threads(
-    config: Config,
-    overlay_boxes_queue: queue.Queue,
-    overlay_confidences_queue: queue.Queue,
-    auto_fire_boxes_queue: queue.Queue,
-    model_path: str
-) -> bool:
-    """由 GUI 呼叫，載入模型並啟動/重啟 AI 執行緒
+# 重啟 AI 執行緒時等待舊執行緒結束的上限（秒）
+_THREAD_STOP_TIMEOUT = 2.0
+
+# YOLO (Ultralytics) 動態匯出時輸入張量使用的符號維度名稱
+_FREE_DIM_BATCH = "batch"
+_FREE_DIM_SPATIAL = ("height", "width")
+
+
+def _free_dim_overrides(config: Config) -> tuple:
+    """DirectML 會話固定的符號維度 ((名稱, 值), ...)；同時作為優化模型快取鍵的一部分"""
+    size = int(config.model_input_size)
+    return ((_FREE_DIM_BATCH, 1),) + tuple((dim_name, size) for dim_name in _FREE_DIM_SPATIAL)
+
+
+def _dml_session_options(config: Config) -> Optional[ort.SessionOptions]:
+    """取得會話選項並強制套用 DirectML 的必要設定
+
+    DirectML 不支援記憶體模式 (mem pattern) 與平行執行模式，
+    CPU 記憶體池對 GPU 上的張量也沒有用途，只會增加常駐記憶體。
+    動態輸入的模型會把符號維度固定為實際推理尺寸，讓 DirectML 只編譯一次。
+    """
+    import onnxruntime as ort
+    from core.session_utils import optimize_onnx_session
+
+    session_options = optimize_onnx_session(config)
+    if session_options:
+        session_options.enable_mem_pattern = False
+        session_options.execution_mode = ort.ExecutionMode.ORT_SEQUENTIAL
+        session_options.enable_cpu_mem_arena = False
+
+        # 固定動態維度（模型中不存在的名稱會被 ORT 忽略；靜態輸入的模型不受影響）
+        try:
+            for dim_name, value in _free_dim_overrides(config):
+                session_options.add_free_dimension_override_by_name(dim_name, value)
+        except Exception as e:
+            logger.warning("ONNX 動態維度固定失敗: %s", e)
+    return session_options
+
+def _write_optimized_cache(config: Config, model_path: str, cache_path: str, providers: list) -> None:
+    """以一次性的會話將 EXTENDED 層級的優化結果序列化到快取路徑
+
+    ORT 會對設定了 optimized_model_filepath 的會話關閉 DirectML 圖融合，
+    因此此會話只用來寫出快取，隨即丟棄，不用於推理。
+    EXTENDED 不含 ALL 的佈局轉換與 DirectML 專屬節點，產生的圖可安全序列化。
+    """
+    import onnxruntime as ort
+
+    session_options = _dml_session_options(config)
+    if not session_options:
+        return
+    session_options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_EXTENDED
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        session_options.optimized_model_filepath = cache_path
+        ort.InferenceSession(model_path, providers=providers, sess_options=session_options)
+        logger.info("已產生優化模型快取: %s", cache_path)
+    except Exception as e:
+        logger.warning("優化模型快取產生失敗: %s", e)
+        try:
+            os.remove(cache_path)
+        except OSError:
+            pass
+
+
+def _create_dml_session(config: Config, model_path: str, providers: list) -> ort.InferenceSession:
+    """建立推理用的 DirectML 會話，優先從 ORT 優化模型快取載入
+
+    快取不存在時先以一次性會話產生；推理會話本身不設定 optimized_model_filepath，
+    並使用 ORT_ENABLE_ALL，讓 DirectML 圖融合（註冊於最高優化層級）得以執行。
+    對已優化的快取圖，前兩層優化幾乎沒有可做的事。
+
+    Raises:
+        Exception: 原始模型也無法建立會話時，拋出 onnxruntime 的例外
+    """
+    import onnxruntime as ort
+    from core.session_utils import get_optimized_model_path, ORT_CACHE_DIR_NAME
+
+    # 獲取優化的會話選項（已套用 DirectML 必要設定）
+    session_options = _dml_session_options(config)
+    if not session_options:
+        return ort.InferenceSession(model_path, providers=providers)
+
+    # 固定後的維度會寫入序列化的圖，需納入快取鍵，更換輸入尺寸時才不會載入舊形狀的快取
+    cache_path = get_optimized_model_path(
+        model_path, os.path.join(project_root, ORT_CACHE_DIR_NAME),
+        dim_overrides=_free_dim_overrides(config),
+    )
+    if not os.path.exists(cache_path):
+        _write_optimized_cache(config, model_path, cache_path, providers)
+
+    if os.path.exists(cache_path):
+        # 快取已是優化後的圖：停用權重預打包，縮短載入時間
+        session_options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        try:
+            session_options.add_session_config_entry("session.disable_prepacking", "1")
+        except Exception as e:
+            logger.warning("ONNX disable_prepacking 設定失敗: %s", e)
+        try:
+            model = ort.InferenceSession(cache_path, providers=providers, sess_options=session_options)
+            logger.info("已載入優化模型快取: %s", cache_path)
+            return model
+        except Exception as e:
+            logger.warning("優化模型快取載入失敗，改用原始模型: %s", e)
+            try:
+                os.remove(cache_path)
+            except OSError:
+                pass
+            session_options = _dml_session_options(config)
+            if not session_options:
+                return ort.InferenceSession(model_path, providers=providers)
+
+    session_options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+    return ort.InferenceSession(model_path, providers=providers, sess_options=session_options)
+
+
+def _build_session(config: Config, model_path: str) -> Optional[ort.InferenceSession]:
+    """載入 ONNX 模型並建立 DirectML 會話（不涉及 GUI，可在背景執行緒執行）
     
     Args:
         config: 配置實例
-        boxes_queue: 檢測框隊列
-        confidences_queue: 置信度隊列
-        model_path: 模型路徑
+        model_path: 模型路徑（相對路徑以項目根目錄為基準）
         
     Returns:
-        是否成功啟動
+        建立好的會話，失敗時為 None
     """
-    global ai_thread, auto_fire_thread
-    
-    # 停止現有線程
-    if ai_thread is not None and ai_thread.is_alive():
-        config.Running = False
-        ai_thread.join()
-        if auto_fire_thread is not None:
-            auto_fire_thread.join()
+    from core.session_utils import get_fp16_model_path, get_int8_model_path, mark_model_variant_bad
 
-    config.Running = True
-    
     # 僅支持 ONNX 模型
     if not model_path.endswith('.onnx'):
         logger.error("僅支援 .onnx 模型格式: %s", model_path)
-        return False
+        return None
     
     # 將相對路徑轉換為絕對路徑（相對於項目根目錄）
     if not os.path.isabs(model_path):
@@ -185,19 +291,32 @@ def start_ai_threads(
     # 檢查文件是否存在
     if not os.path.exists(model_path):
         logger.error("模型文件不存在: %s", model_path)
-        return False
+        return None
     
-    model = None
+    # 啟用量化時優先使用 INT8 版本，否則在啟用 FP16 時使用 FP16 版本；
+    # 兩者輸入/輸出皆維持 float32，ai_logic_loop 不需更改
+    variant_path = get_int8_model_path(model_path) if config.quantized_enabled else None
+    if variant_path:
+        logger.info("使用 INT8 量化模型: %s", variant_path)
+    elif config.fp16_enabled:
+        variant_path = get_fp16_model_path(model_path)
+        if variant_path == model_path:
+            variant_path = None
+
     try:
         # 僅使用 DirectML 提供者
         providers = ['DmlExecutionProvider']
 
-        # 獲取優化的會話選項
-        session_options = optimize_onnx_session(config)
-        if session_options:
-            model = ort.InferenceSession(model_path, providers=providers, sess_options=session_options)
-        else:
-            model = ort.InferenceSession(model_path, providers=providers)
+        model = None
+        if variant_path:
+            try:
+                model = _create_dml_session(config, variant_path, providers)
+            except Exception as e:
+                # 轉換/量化後的圖可能含 DirectML 無法執行的節點：標記失效並改用原始模型
+                logger.warning("模型 %s 建立會話失敗，改用原始 FP32 模型: %s", variant_path, e)
+                mark_model_variant_bad(variant_path)
+        if model is None:
+            model = _create_dml_session(config, model_path, providers)
 
         # 獲取實際使用的提供者
         actual_providers = model.get_providers()
@@ -210,31 +329,115 @@ def start_ai_threads(
     except Exception as e:
         logger.error("載入 ONNX 模型失敗: %s", e)
         logger.error("請確認已安裝 onnxruntime-directml 且系統支援 DirectML")
-        return False
+        return None
+
+    return model
+
+
+def _spawn_threads(
+    config: Config,
+    model: ort.InferenceSession,
+    latest_frame: LatestFrame,
+) -> None:
+    """以已建立的會話啟動 AI 偵測與自動開火執行緒"""
+    from core.ai_loop import ai_logic_loop
+    from core.auto_fire import auto_fire_loop
+
+    global ai_thread, auto_fire_thread
 
     ai_thread = threading.Thread(
         target=ai_logic_loop,
-        args=(config, model, 'onnx', overlay_boxes_queue, overlay_confidences_queue, auto_fire_boxes_queue),
+        args=(config, model, 'onnx', latest_frame),
         daemon=True
     )
     auto_fire_thread = threading.Thread(
         target=auto_fire_loop,
-        args=(config, auto_fire_boxes_queue),
+        args=(config, latest_frame),
         daemon=True
     )
     
     ai_thread.start()
     auto_fire_thread.start()
+
+
+def _preload_session(config: Config, model_path: str) -> Future:
+    """在背景執行緒建立會話，讓耗時的 DirectML 初始化與 GUI 建立並行
+    
+    Returns:
+        完成時結果為 _build_session 的回傳值
+    """
+    future: Future = Future()
+
+    def _worker() -> None:
+        started = time.perf_counter()
+        try:
+            future.set_result(_build_session(config, model_path))
+        except BaseException as e:  # 確保等待端不會永久阻塞
+            future.set_exception(e)
+        logger.info("背景模型載入耗時 %.2f 秒", time.perf_counter() - started)
+
+    threading.Thread(target=_worker, name="ModelPreload", daemon=True).start()
+    return future
+
+
+def start_ai_threads(
+    config: Config,
+    latest_frame: LatestFrame,
+    model_path: str,
+    session_future: Optional[Future] = None,
+) -> bool:
+    """由 GUI 呼叫，載入模型並啟動/重啟 AI 執行緒
+    
+    Args:
+        config: 配置實例
+        latest_frame: 最新檢測結果的共享緩衝區
+        model_path: 模型路徑
+        session_future: 已在背景載入同一模型的 Future（由 _preload_session 建立）
+        
+    Returns:
+        是否成功啟動
+    """
+    # 停止現有線程：設定取消旗標後限時等待，避免卡在無法中斷的 DirectML 推理時凍結 GUI
+    if ai_thread is not None and ai_thread.is_alive():
+        config.cancel_event.set()
+        ai_thread.join(timeout=_THREAD_STOP_TIMEOUT)
+        if ai_thread.is_alive():
+            logger.warning("AI 執行緒未在 %.1f 秒內結束，將於目前推理完成後自行退出", _THREAD_STOP_TIMEOUT)
+        if auto_fire_thread is not None:
+            auto_fire_thread.join(timeout=_THREAD_STOP_TIMEOUT)
+
+    # 新的一批執行緒使用新的取消旗標；舊執行緒持有的會話在其結束後即可被回收
+    config.cancel_event = threading.Event()
+    config.Running = True
+
+    if session_future is not None:
+        wait_start = time.perf_counter()
+        model = session_future.result()
+        logger.info("等待背景模型載入 %.2f 秒", time.perf_counter() - wait_start)
+    else:
+        model = _build_session(config, model_path)
+    if model is None:
+        return False
+
+    _spawn_threads(config, model, latest_frame)
     return True
 
 
 def main():
     """主程式入口"""
+    _ensure_pywin32()
+    from win_utils import check_and_request_admin, test_ddxoft_functions, ensure_ddxoft_ready
+    from core.key_listener import aim_toggle_key_listener
+
     # 檢查管理員權限
     check_and_request_admin()
 
     config = Config()
     load_config(config)
+
+    # 立即在背景建立 ONNX 會話，與下方的 GUI 建立並行
+    preload_model_path = config.model_path
+    session_future = _preload_session(config, preload_model_path) if preload_model_path else None
     
     # 調試：顯示載入的滑鼠移動方式
     logger.info("配置載入：滑鼠移動方式 %s", config.mouse_move_method)
@@ -253,19 +456,21 @@ def main():
             config.mouse_move_method = 'mouse_event'
             config.mouse_click_method = 'mouse_event'
     
-    # 優化：使用配置中的隊列大小設置
-    overlay_boxes_queue: queue.Queue = queue.Queue(maxsize=config.max_queue_size)
-    overlay_confidences_queue: queue.Queue = queue.Queue(maxsize=config.max_queue_size)
-    auto_fire_boxes_queue: queue.Queue = queue.Queue(maxsize=config.max_queue_size)
+    # AI 循環寫入、覆蓋層與自動開火各自讀取的最新檢測結果
+    from core.latest_frame import LatestFrame
+    latest_frame = LatestFrame()
 
     # 創建啟動函數的閉包
     def start_threads_callback(model_path: str) -> bool:
+        nonlocal session_future
+        # 背景預載的會話只在模型路徑未變更時使用一次
+        future = session_future if model_path == preload_model_path else None
+        session_future = None
         return start_ai_threads(
             config,
-            overlay_boxes_queue,
-            overlay_confidences_queue,
-            auto_fire_boxes_queue,
+            latest_frame,
             model_path,
+            session_future=future,
         )
 
     # 啟動快捷鍵監聽
@@ -278,6 +483,9 @@ def main():
 
     from PyQt6.QtWidgets import QApplication
     from PyQt6.QtCore import Qt
+    from gui.overlay import PyQtOverlay
+    from gui.status_panel import StatusPanel
+    from gui.disclaimer_dialog import DisclaimerDialog
 
     # 必須在 QApplication 建立前設定屬性
     QApplication.setAttribute(Qt.ApplicationAttribute.AA_UseDesktopOpenGL)
@@ -305,7 +513,7 @@ def main():
         save_config(config)
     
     # 建立並顯示主要的繪圖覆蓋層 (人物框, FOV)
-    main_overlay = PyQtOverlay(overlay_boxes_queue, overlay_confidences_queue, config)
+    main_overlay = PyQtOverlay(latest_frame, config)
     main_overlay.show()
 
     # 建立並顯示新的狀態面板（根據配置決定是否顯示）
@@ -101,6 +101,16 @@ from .console import (
 
 # ===== 主要滑鼠移動函數 =====
 
+# 移動方式 -> 實作函數；未知方式使用 mouse_event（安全穩定）
+_MOVE_METHODS = {
+    "sendinput": send_mouse_move_sendinput,
+    "mouse_event": send_mouse_move_mouse_event,
+    "ddxoft": send_mouse_move_ddxoft,
+    "arduino": send_mouse_move_arduino,
+    "xbox": send_mouse_move_xbox,
+}
+
+
 def send_mouse_move(dx, dy, method="mouse_event"):
     """
     主要滑鼠移動函數
@@ -111,22 +121,13 @@ def send_mouse_move(dx, dy, method="mouse_event"):
     - "arduino": Arduino Leonardo (USB HID，非常隱蔽)
     - "xbox": Xbox 360 虛擬手把 (透過 ViGEmBus，適用手把遊戲)
     """
-    if abs(dx) < 1 and abs(dy) < 1:
-        return  # 移動量太小，跳過
-    
-    if method == "sendinput":
-        send_mouse_move_sendinput(dx, dy)
-    elif method == "mouse_event":
-        send_mouse_move_mouse_event(dx, dy)
-    elif method == "ddxoft":
-        send_mouse_move_ddxoft(dx, dy)
-    elif method == "arduino":
-        send_mouse_move_arduino(dx, dy)
-    elif method == "xbox":
-        send_mouse_move_xbox(dx, dy)
-    else:
-        # 默認使用 mouse_event 方式（安全穩定）
-        send_mouse_move_mouse_event(dx, dy)
+    # 先截斷為整數，下游不必再轉換；兩軸皆為 0 時跳過（移動量太小）
+    idx = int(dx)
+    idy = int(dy)
+    if not (idx | idy):
+        return
+
+    _MOVE_METHODS.get(method, send_mouse_move_mouse_event)(idx, idy)
 
 
 # 公開的 API 列表
@@ -5,14 +5,25 @@ from __future__ import annotations
 
 import ctypes
 import os
+import subprocess
 import sys
 
+# 於導入時解析一次 IsUserAnAdmin 並設定回傳型別
+try:
+    _IsUserAnAdmin = ctypes.WinDLL("shell32", use_last_error=True).IsUserAnAdmin
+    _IsUserAnAdmin.argtypes = []
+    _IsUserAnAdmin.restype = ctypes.c_int
+except (AttributeError, OSError):
+    _IsUserAnAdmin = None
+
 
 def is_admin() -> bool:
     """檢查當前程序是否以管理員權限運行"""
+    if _IsUserAnAdmin is None:
+        return False
     try:
-        return bool(ctypes.windll.shell32.IsUserAnAdmin())
-    except (AttributeError, OSError):
+        return bool(_IsUserAnAdmin())
+    except OSError:
         return False
 
 
@@ -24,16 +35,20 @@ def request_admin_privileges():
     try:
         print("[權限管理] 正在以管理員權限重新啟動程序...")
         
-        # 獲取當前腳本的完整路徑
-        script_path = os.path.abspath(sys.argv[0])
+        # 保留所有命令行參數，避免旗標遺失而需要再次重新啟動
+        # 打包後的 exe 本身即為 sys.executable，只需傳入其餘參數
+        if getattr(sys, "frozen", False):
+            params = subprocess.list2cmdline(sys.argv[1:])
+        else:
+            params = subprocess.list2cmdline([os.path.abspath(sys.argv[0])] + sys.argv[1:])
         
-        # 使用 ShellExecute 以管理員權限啟動
+        # 使用 ShellExecute 以管理員權限啟動，並沿用目前工作目錄（否則預設為 System32）
         result = ctypes.windll.shell32.ShellExecuteW(
             None, 
             "runas", 
             sys.executable, 
-            f'"{script_path}"', 
-            None, 
+            params, 
+            os.getcwd(), 
             1  # SW_SHOW
         )
         
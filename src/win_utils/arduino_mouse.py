@@ -9,6 +9,7 @@ import sys
 import struct
 import threading
 import time
+from collections import deque
 from typing import Optional
 
 # 使用本地的依賴模組 (src/python/dependencies)
@@ -16,20 +17,21 @@ _src_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 _python_dir = os.path.join(_src_dir, 'python')
 _deps_dir = os.path.join(_python_dir, 'dependencies')
 
-# 移除可能已載入的 serial 模組
-for mod_name in list(sys.modules.keys()):
-    if mod_name == 'serial' or mod_name.startswith('serial.'):
-        del sys.modules[mod_name]
-
-# 確保依賴路徑優先
-if _deps_dir in sys.path:
-    sys.path.remove(_deps_dir)
-sys.path.insert(0, _deps_dir)
+# 確保依賴路徑可用（main.py 啟動時已將其置於最前，這裡僅補上單獨導入的情況）
+if _deps_dir not in sys.path:
+    sys.path.insert(0, _deps_dir)
 
 import serial
 import serial.tools.list_ports
 
 
+# 兩個 signed char (dx, dy)；預先編譯格式字串，直接寫入預先配置的緩衝區
+_MOVE_STRUCT = struct.Struct('bb')
+_PACK_MOVE_INTO = _MOVE_STRUCT.pack_into
+_MOVE_SIZE = _MOVE_STRUCT.size
+_WRITE_BUFFER_SIZE = 64  # 單次 serial.write 最多送出的位元組數（32 個移動封包）
+
+
 class ArduinoMouse:
     """Arduino Leonardo 滑鼠控制器
 
@@ -42,6 +44,12 @@ class ArduinoMouse:
         self._connected = False
         self._com_port: str = ""
         self._baud_rate: int = 115200
+        # 背景寫入：move() 只負責排入佇列，由寫入執行緒合併後一次送出
+        self._pending: deque = deque()
+        self._pending_event = threading.Event()
+        self._writer_thread: Optional[threading.Thread] = None
+        # 僅由寫入執行緒使用的封包緩衝區，避免每次送出都配置新的 bytes
+        self._write_buffer = bytearray(_WRITE_BUFFER_SIZE)
 
     def connect(self, com_port: str, baud_rate: int = 115200) -> bool:
         """連線到 Arduino Leonardo
@@ -69,6 +77,8 @@ class ArduinoMouse:
                 self._connected = True
                 # 等待 Arduino 重啟（Leonardo 連線時會自動重啟）
                 time.sleep(2)
+                self._pending.clear()
+                self._start_writer()
                 print(f"[Arduino] 成功連線到 {com_port}")
                 return True
             except serial.SerialException as e:
@@ -89,6 +99,7 @@ class ArduinoMouse:
                 except Exception:
                     pass
             self._connected = False
+            self._pending_event.set()  # 喚醒寫入執行緒使其結束
             print("[Arduino] 已斷開連線")
 
     def is_connected(self) -> bool:
@@ -96,7 +107,7 @@ class ArduinoMouse:
         return self._connected and self._serial is not None and self._serial.is_open
 
     def move(self, dx: int, dy: int):
-        """移動滑鼠
+        """移動滑鼠（排入背景寫入佇列後立即返回）
 
         Args:
             dx: X 方向移動量 (-128 ~ 127)
@@ -105,21 +116,65 @@ class ArduinoMouse:
         if not self.is_connected():
             return
 
-        # 限制範圍在 -128 到 127 之間 (signed char)
+        # 限制範圍在 -128 到 127 之間 (signed char)；入列前即轉為整數，寫入執行緒才能直接打包
         dx = max(-128, min(127, int(dx)))
         dy = max(-128, min(127, int(dy)))
 
-        try:
-            # struct.pack('bb') 代表打包成兩個 signed char (byte)
-            data = struct.pack('bb', dx, dy)
-            with self._lock:
-                if self._serial and self._serial.is_open:
-                    self._serial.write(data)
-        except serial.SerialException:
-            # 連線可能已斷開
-            self._connected = False
-        except Exception:
-            pass
+        self._pending.append((dx, dy))
+        self._pending_event.set()
+
+    def _start_writer(self):
+        """啟動背景寫入執行緒（已在執行時不重複啟動）"""
+        if self._writer_thread is not None and self._writer_thread.is_alive():
+            return
+        self._writer_thread = threading.Thread(
+            target=self._writer_loop, name="ArduinoWriter", daemon=True
+        )
+        self._writer_thread.start()
+
+    def _writer_loop(self):
+        """取出所有待送的移動量，合併後以單次 serial.write 送出"""
+        pending = self._pending
+        buffer = self._write_buffer
+        view = memoryview(buffer)
+        while self._connected:
+            self._pending_event.wait(0.1)
+            self._pending_event.clear()
+            if not pending:
+                continue
+
+            try:
+                # 合併積壓的移動量
+                total_x = total_y = 0
+                while pending:
+                    dx, dy = pending.popleft()
+                    total_x += dx
+                    total_y += dy
+
+                # 總量超出 signed char 時拆成多個封包，保持總位移不變；
+                # 封包直接寫入緩衝區，緩衝區滿時分批送出
+                while total_x or total_y:
+                    offset = 0
+                    while (total_x or total_y) and offset < _WRITE_BUFFER_SIZE:
+                        step_x = max(-128, min(127, total_x))
+                        step_y = max(-128, min(127, total_y))
+                        _PACK_MOVE_INTO(buffer, offset, step_x, step_y)
+                        offset += _MOVE_SIZE
+                        total_x -= step_x
+                        total_y -= step_y
+
+                    with self._lock:
+                        if self._serial and self._serial.is_open:
+                            self._serial.write(view[:offset])
+            except serial.SerialException as e:
+                # 連線可能已斷開：結束寫入執行緒，move() 也會因未連線而不再排入
+                print(f"[Arduino] 寫入失敗，連線已中斷: {e}")
+                self._connected = False
+                pending.clear()
+            except Exception as e:
+                # 捨棄這批移動量後繼續服務，避免寫入執行緒結束後佇列無人取出
+                print(f"[Arduino] 送出移動量時發生錯誤: {e}")
+                pending.clear()
 
     @property
     def com_port(self) -> str:
@@ -136,14 +191,27 @@ def send_mouse_move_arduino(dx: int, dy: int):
     arduino_mouse.move(dx, dy)
 
 
-def get_available_com_ports() -> list[str]:
+# COM 埠列舉（Windows 上經由 SetupAPI，約 50~200ms）的短期快取：(時間戳, 埠列表)
+_PORTS_CACHE_TTL = 1.0
+_ports_cache: tuple[float, list[str]] = (float('-inf'), [])
+
+
+def get_available_com_ports(force_refresh: bool = False) -> list[str]:
     """獲取可用的 COM 埠列表
 
+    Args:
+        force_refresh: 忽略快取並重新列舉（例如使用者按下刷新按鈕）
+
     Returns:
         COM 埠名稱列表 (例如 ['COM1', 'COM3', 'COM7'])
     """
-    ports = serial.tools.list_ports.comports()
-    return [port.device for port in ports]
+    global _ports_cache
+    timestamp, ports = _ports_cache
+    now = time.monotonic()
+    if force_refresh or now - timestamp >= _PORTS_CACHE_TTL:
+        ports = [port.device for port in serial.tools.list_ports.comports()]
+        _ports_cache = (now, ports)
+    return list(ports)
 
 
 def connect_arduino(com_port: str, baud_rate: int = 115200) -> bool:
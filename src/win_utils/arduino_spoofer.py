@@ -1,9 +1,34 @@
 import os
 import shutil
 import re
-import glob
 import serial.tools.list_ports
 
+# 偽裝目標: Logitech G502 HERO
+# VID: 0x046D
+# PID: 0xC07D
+_SPOOF_VALUES = {
+    b'leonardo.build.vid': b'0x046D',
+    b'leonardo.build.pid': b'0xC07D',
+    b'leonardo.build.usb_product': b'"Logitech G502 HERO Gaming Mouse"',
+}
+
+# 一次比對三個需修改的鍵（允許行首空白，保留原本的換行符）
+_SPOOF_RE = re.compile(rb'^[ \t]*(leonardo\.build\.(?:vid|pid|usb_product))=[^\r\n]*', re.M)
+
+# AVR 套件版本資料夾名稱（例如 1.8.6）中的數字段
+_VERSION_RE = re.compile(r'\d+')
+
+
+def _spoof_repl(match):
+    key = match.group(1)
+    return key + b'=' + _SPOOF_VALUES[key]
+
+
+def _version_key(name):
+    """將版本資料夾名稱轉為可比較的數字序列"""
+    return tuple(int(part) for part in _VERSION_RE.findall(name))
+
+
 def find_boards_txt():
     """尋找 Arduino IDE 的 boards.txt 檔案位置"""
     possible_paths = []
@@ -12,11 +37,15 @@ def find_boards_txt():
     local_appdata = os.environ.get('LOCALAPPDATA', '')
     if local_appdata:
         # 搜尋所有版本，取最新的
-        pattern = os.path.join(local_appdata, r'Arduino15\packages\arduino\hardware\avr\*\boards.txt')
-        found = glob.glob(pattern)
-        if found:
-            # 排序取版本號最大的
-            possible_paths.extend(sorted(found, reverse=True))
+        avr_dir = os.path.join(local_appdata, r'Arduino15\packages\arduino\hardware\avr')
+        try:
+            with os.scandir(avr_dir) as entries:
+                versions = [entry.name for entry in entries if entry.is_dir()]
+        except OSError:
+            versions = []
+        # 依版本號由大到小排序
+        for name in sorted(versions, key=_version_key, reverse=True):
+            possible_paths.append(os.path.join(avr_dir, name, 'boards.txt'))
 
     # 2. Program Files (Legacy IDE)
     program_files_x86 = os.environ.get('ProgramFiles(x86)', 'C:\\Program Files (x86)')
@@ -42,47 +71,26 @@ def spoof_arduino_board():
     if not os.path.exists(backup_file):
         shutil.copy2(boards_file, backup_file)
 
+    temp_file = boards_file + ".tmp"
     try:
-        with open(boards_file, 'r', encoding='utf-8') as f:
-            lines = f.readlines()
-            
-        new_lines = []
-        spoofed = False
-        
-        # 偽裝目標: Logitech G502 HERO
-        # VID: 0x046D
-        # PID: 0xC07D
-        
-        for line in lines:
-            line_strip = line.strip()
-            
-            # 修改 VID
-            if line_strip.startswith('leonardo.build.vid='):
-                new_lines.append('leonardo.build.vid=0x046D\n')
-                spoofed = True
-                continue
-                
-            # 修改 PID
-            if line_strip.startswith('leonardo.build.pid='):
-                new_lines.append('leonardo.build.pid=0xC07D\n')
-                spoofed = True
-                continue
-                
-            # 修改產品名稱
-            if line_strip.startswith('leonardo.build.usb_product='):
-                new_lines.append('leonardo.build.usb_product="Logitech G502 HERO Gaming Mouse"\n')
-                spoofed = True
-                continue
-                
-            new_lines.append(line)
-
-        # 寫回檔案
-        with open(boards_file, 'w', encoding='utf-8') as f:
-            f.writelines(new_lines)
+        with open(boards_file, 'rb') as f:
+            data = f.read()
+
+        new_data = _SPOOF_RE.sub(_spoof_repl, data)
+
+        # 先寫入暫存檔再原子替換，避免寫入中斷留下不完整的 boards.txt
+        with open(temp_file, 'wb') as f:
+            f.write(new_data)
+        os.replace(temp_file, boards_file)
             
         return True, boards_file
         
     except Exception as e:
+        if os.path.exists(temp_file):
+            try:
+                os.remove(temp_file)
+            except OSError:
+                pass
         # 如果出錯，嘗試還原
         if os.path.exists(backup_file):
             shutil.copy2(backup_file, boards_file)
@@ -3,12 +3,34 @@
 
 import ctypes
 
+SW_HIDE = 0
+SW_SHOW = 5
+
+# 於導入時解析一次 Win32 函數並設定 argtypes/restype，避免每次呼叫經由 ctypes.windll 查找
+try:
+    _kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+    _user32 = ctypes.WinDLL("user32", use_last_error=True)
+
+    _GetConsoleWindow = _kernel32.GetConsoleWindow
+    _GetConsoleWindow.argtypes = []
+    _GetConsoleWindow.restype = ctypes.c_void_p
+
+    _ShowWindow = _user32.ShowWindow
+    _ShowWindow.argtypes = [ctypes.c_void_p, ctypes.c_int]
+    _ShowWindow.restype = ctypes.c_int
+
+    _IsWindowVisible = _user32.IsWindowVisible
+    _IsWindowVisible.argtypes = [ctypes.c_void_p]
+    _IsWindowVisible.restype = ctypes.c_int
+except (AttributeError, OSError):
+    # 非 Windows 環境：呼叫時會在各函數的例外處理中回報失敗
+    _GetConsoleWindow = _ShowWindow = _IsWindowVisible = None
+
 
 def get_console_window():
     """獲取當前控制台視窗的句柄"""
     try:
-        kernel32 = ctypes.windll.kernel32
-        return kernel32.GetConsoleWindow()
+        return _GetConsoleWindow()
     except Exception as e:
         print(f"[終端控制] 獲取控制台視窗失敗: {e}")
         return None
@@ -19,9 +41,7 @@ def show_console():
     try:
         hwnd = get_console_window()
         if hwnd:
-            user32 = ctypes.windll.user32
-            SW_SHOW = 5
-            user32.ShowWindow(hwnd, SW_SHOW)
+            _ShowWindow(hwnd, SW_SHOW)
             print("[終端控制] 終端視窗已顯示")
             return True
         else:
@@ -37,9 +57,7 @@ def hide_console():
     try:
         hwnd = get_console_window()
         if hwnd:
-            user32 = ctypes.windll.user32
-            SW_HIDE = 0
-            user32.ShowWindow(hwnd, SW_HIDE)
+            _ShowWindow(hwnd, SW_HIDE)
             return True
         else:
             return False
@@ -53,8 +71,7 @@ def is_console_visible():
     try:
         hwnd = get_console_window()
         if hwnd:
-            user32 = ctypes.windll.user32
-            return user32.IsWindowVisible(hwnd)
+            return _IsWindowVisible(hwnd)
         return False
     except Exception:
         return False
@@ -0,0 +1,33 @@
+/* ddx_shim.c - ddxoft DD_movR 的 C 橋接層
+ *
+ * 將移動量的範圍限制與 DD_movR 呼叫合併在一次 ctypes 呼叫內完成，
+ * 減少 Python 端每次移動執行的位元組碼。DD_movR 的位址由 Python 端
+ * 在 ddxoft.dll 初始化成功後傳入，確保使用同一個已初始化的 DLL。
+ *
+ * 編譯（位元數需與 Python 一致），產生的 ddx_shim.dll 放在本檔案同目錄：
+ *     MSVC:  cl /O2 /LD ddx_shim.c /Fe:ddx_shim.dll
+ *     MinGW: gcc -O2 -shared -o ddx_shim.dll ddx_shim.c
+ * 找不到 ddx_shim.dll 時 ddxoft_mouse.py 會自動使用原本的 Python 路徑。
+ */
+
+#define SHIM_EXPORT __declspec(dllexport)
+#define DD_LIMIT 32767
+
+typedef int (*dd_movR_fn)(int, int);
+
+static dd_movR_fn g_movR = 0;
+
+/* 設定 DD_movR 函數位址；成功返回 1 */
+SHIM_EXPORT int ddx_shim_init(void *movR)
+{
+    g_movR = (dd_movR_fn)movR;
+    return g_movR != 0;
+}
+
+/* 限制範圍後呼叫 DD_movR，返回值與 DD_movR 相同（1 = 成功） */
+SHIM_EXPORT int ddx_shim_movR(int dx, int dy)
+{
+    if (dx < -DD_LIMIT) dx = -DD_LIMIT; else if (dx > DD_LIMIT) dx = DD_LIMIT;
+    if (dy < -DD_LIMIT) dy = -DD_LIMIT; else if (dy > DD_LIMIT) dy = DD_LIMIT;
+    return g_movR ? g_movR(dx, dy) : 0;
+}
@@ -2,11 +2,57 @@
 """ddxoft (最隱蔽) - 面向對象接口"""
 
 import ctypes
+import os
 import time
 
 from .mouse_move import send_mouse_move_mouse_event
 
 
+# ddxoft.dll 的候選位置（絕對路徑）：當前目錄、src、lib，以及本模組所在目錄
+_DLL_CANDIDATES = tuple(
+    os.path.abspath(p) for p in ("ddxoft.dll", "src/ddxoft.dll", "lib/ddxoft.dll")
+) + (os.path.join(os.path.dirname(os.path.abspath(__file__)), "ddxoft.dll"),)
+
+# 可選的 C 橋接層（由 ddx_shim.c 編譯），存在時移動改為直接呼叫其 ddx_shim_movR
+_SHIM_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "ddx_shim.dll")
+_shim_dll = None
+_shim_movR = None
+
+# 移動統計（_ddxoft_move_count 與 move_relative 的成功/失敗計數及 last_status）預設關閉，
+# 除錯時設為 True 才在每次移動時記錄；點擊統計不受影響
+_STATS_ENABLED = False
+
+# DLL 初始化成功後設為 True；熱路徑只檢查此旗標，不必每次呼叫 ensure_initialized()
+_DDX_READY = False
+
+# 點擊按下與釋放之間的間隔（奈秒）；以忙等待取代 sleep，避免被排程器延後到 1ms 以上
+_CLICK_HOLD_NS = 200_000
+
+
+def _load_move_shim(dd_movR):
+    """載入 ddx_shim.dll 並傳入已初始化的 DD_movR 位址
+
+    Returns:
+        已設定原型的 ddx_shim_movR；檔案不存在或載入失敗時為 None
+    """
+    global _shim_dll
+    if not os.path.isfile(_SHIM_PATH):
+        return None
+    try:
+        shim = ctypes.CDLL(_SHIM_PATH)
+        shim.ddx_shim_init.argtypes = [ctypes.c_void_p]
+        shim.ddx_shim_init.restype = ctypes.c_int
+        shim.ddx_shim_movR.argtypes = [ctypes.c_int, ctypes.c_int]
+        shim.ddx_shim_movR.restype = ctypes.c_int
+        if shim.ddx_shim_init(ctypes.cast(dd_movR, ctypes.c_void_p)) != 1:
+            return None
+        _shim_dll = shim  # 保持引用，避免 DLL 被卸載
+        return shim.ddx_shim_movR
+    except Exception as e:
+        print(f"[ddxoft] C 橋接層載入失敗，改用 Python 路徑: {e}")
+        return None
+
+
 class DDXoftMouse:
     """DDXoft 滑鼠控制器
     
@@ -24,13 +70,24 @@ class DDXoftMouse:
         last_status: 最後一次操作狀態
     """
     
+    # 固定屬性集合：以 slot 取代 __dict__，熱路徑上的屬性存取更快、實例更小
+    __slots__ = (
+        "dll", "_DD_btn", "_DD_str", "_DD_movR", "available", "subsequent_init_failed",
+        "success_count", "failure_count", "last_status", "_stats_buf",
+    )
+    
     def __init__(self):
         self.dll = None
+        # 已設定原型的 DLL 函數，初始化後直接呼叫，省去每次經由 self.dll 查找
+        self._DD_btn = None
+        self._DD_str = None
+        self._DD_movR = None
         self.available = False
         self.subsequent_init_failed = False  # 記錄是否初始化失敗過，防止重複嘗試
         self.success_count = 0      # 成功次數
         self.failure_count = 0      # 失敗次數
         self.last_status = None     # 最後一次操作狀態
+        self._stats_buf = {}        # get_statistics 重複使用的結果字典
 
     def ensure_initialized(self):
         """Lazy-load the ddxoft DLL when needed."""
@@ -45,6 +102,7 @@ class DDXoftMouse:
     
     def _init_dll(self):
         """初始化 ddxoft DLL"""
+        global _DDX_READY, _shim_movR
         if self.available:
             return True
         
@@ -53,44 +111,40 @@ class DDXoftMouse:
             return False
             
         try:
-            # 嘗試載入 ddxoft DLL（常見位置）
-            dll_paths = [
-                "ddxoft.dll",  # 當前目錄
-                "./ddxoft.dll",  # 相對路徑
-                "src/ddxoft.dll",  # src 目錄
-                "lib/ddxoft.dll",  # lib 目錄
-            ]
-            
-            for dll_path in dll_paths:
-                try:
-                    self.dll = ctypes.CDLL(dll_path)
-                    break
-                except OSError:
-                    continue
-            
-            if self.dll is None:
+            # 先以 os.path.isfile 找出 DLL，只對找到的絕對路徑呼叫一次 CDLL
+            dll_path = next((p for p in _DLL_CANDIDATES if os.path.isfile(p)), None)
+            if dll_path is None:
                 self.subsequent_init_failed = True
                 return False
-                
-            # 設定函數原型
+
+            # 以絕對路徑載入並使用預設 winmode：DLL 所在資料夾與 os.add_dll_directory
+            # 加入的資料夾都會被用來尋找其相依 DLL
+            self.dll = ctypes.CDLL(dll_path)
+
+            # 設定函數原型（同時經由 GetProcAddress 解析出各函數，熱路徑不再有首次查找）
             self.dll.DD_btn.argtypes = [ctypes.c_int]
             self.dll.DD_btn.restype = ctypes.c_int
             self.dll.DD_str.argtypes = [ctypes.c_char_p]
             self.dll.DD_str.restype = ctypes.c_int
             self.dll.DD_movR.argtypes = [ctypes.c_int, ctypes.c_int]
             self.dll.DD_movR.restype = ctypes.c_int
+            self._DD_btn = self.dll.DD_btn
+            self._DD_str = self.dll.DD_str
+            self._DD_movR = self.dll.DD_movR
             
             # 執行初始化序列
             # 步驟1: 調用 DD_btn(0) 進行初始化
             # 注意: 如果缺少驅動，這步可能會彈出 "Scarica ddxxxx.sys" 的訊息框
-            btn_result = self.dll.DD_btn(0)
+            btn_result = self._DD_btn(0)
             
             # 步驟2: 調用 DD_str 設定免費版標識
-            str_result = self.dll.DD_str(b"dd2")
+            str_result = self._DD_str(b"dd2")
             
             # 檢查初始化結果
             if btn_result == 1 and str_result == 1:
                 self.available = True
+                _shim_movR = _load_move_shim(self._DD_movR)
+                _DDX_READY = True
                 return True
             else:
                 self.subsequent_init_failed = True
@@ -105,36 +159,47 @@ class DDXoftMouse:
     
     def move_relative(self, dx, dy):
         """相對移動滑鼠"""
-        if not self.ensure_initialized():
+        if not _DDX_READY and not self.ensure_initialized():
             self.failure_count += 1
             self.last_status = "DLL_NOT_AVAILABLE"
             return False
         
         try:
-            # 確保參數為整數且在合理範圍內
-            dx = max(-32767, min(32767, int(dx)))
-            dy = max(-32767, min(32767, int(dy)))
+            # 確保參數為整數且在合理範圍內（移動量通常很小，邊界分支幾乎不會進入）
+            dx = int(dx)
+            dy = int(dy)
+            if dx < -32767:
+                dx = -32767
+            elif dx > 32767:
+                dx = 32767
+            if dy < -32767:
+                dy = -32767
+            elif dy > 32767:
+                dy = 32767
             
             # 使用 DD_movR 進行相對移動
-            result = self.dll.DD_movR(dx, dy)
+            result = self._DD_movR(dx, dy)
             
             if result == 1:
-                self.success_count += 1
-                self.last_status = "SUCCESS"
+                if _STATS_ENABLED:
+                    self.success_count += 1
+                    self.last_status = "SUCCESS"
                 return True
             else:
-                self.failure_count += 1
-                self.last_status = f"FAILED_CODE_{result}"
+                if _STATS_ENABLED:
+                    self.failure_count += 1
+                    self.last_status = f"FAILED_CODE_{result}"
                 return False
                 
         except Exception as e:
-            self.failure_count += 1
-            self.last_status = f"EXCEPTION_{type(e).__name__}"
+            if _STATS_ENABLED:
+                self.failure_count += 1
+                self.last_status = f"EXCEPTION_{type(e).__name__}"
             return False
     
     def click_left(self):
         """左鍵點擊"""
-        if not self.ensure_initialized():
+        if not _DDX_READY and not self.ensure_initialized():
             self.failure_count += 1
             self.last_status = "DLL_NOT_AVAILABLE"
             return False
@@ -142,10 +207,12 @@ class DDXoftMouse:
         try:
             # 使用 DD_btn 進行滑鼠點擊
             # 1 = 左鍵按下, 2 = 左鍵釋放
-            down_result = self.dll.DD_btn(1)
+            down_result = self._DD_btn(1)
             # 添加微小延遲確保按下和釋放被正確識別
-            time.sleep(0.001)  # 1ms延遲
-            up_result = self.dll.DD_btn(2)
+            release_at = time.perf_counter_ns() + _CLICK_HOLD_NS
+            while time.perf_counter_ns() < release_at:
+                pass
+            up_result = self._DD_btn(2)
             
             if down_result == 1 and up_result == 1:
                 self.success_count += 1
@@ -166,16 +233,19 @@ class DDXoftMouse:
         return self.available
     
     def get_statistics(self):
-        """獲取使用統計"""
+        """獲取使用統計
+
+        返回的字典會在下次呼叫時被就地更新，需保留快照時請自行 copy()
+        """
         total = self.success_count + self.failure_count
         success_rate = (self.success_count / total * 100) if total > 0 else 0
-        return {
-            'success_count': self.success_count,
-            'failure_count': self.failure_count,
-            'total_count': total,
-            'success_rate': success_rate,
-            'last_status': self.last_status
-        }
+        stats = self._stats_buf
+        stats['success_count'] = self.success_count
+        stats['failure_count'] = self.failure_count
+        stats['total_count'] = total
+        stats['success_rate'] = success_rate
+        stats['last_status'] = self.last_status
+        return stats
     
     def reset_statistics(self):
         """重置統計數據"""
@@ -221,14 +291,18 @@ def send_mouse_move_ddxoft(dx, dy):
     """ddxoft 移動（最隱蔽）"""
     global _ddxoft_move_count
 
-    if not ddxoft_mouse.ensure_initialized():
+    if not _DDX_READY and not ddxoft_mouse.ensure_initialized():
         send_mouse_move_mouse_event(dx, dy)
         return
 
-    _ddxoft_move_count += 1
+    if _STATS_ENABLED:
+        _ddxoft_move_count += 1
     
-    # 嘗試使用 ddxoft
-    if ddxoft_mouse.move_relative(dx, dy):
+    # 嘗試使用 ddxoft；有 C 橋接層時範圍限制與 DD_movR 在一次呼叫內完成
+    if _shim_movR is not None:
+        if _shim_movR(int(dx), int(dy)) == 1:
+            return
+    elif ddxoft_mouse.move_relative(dx, dy):
         return  # 成功，直接返回
     
     # ddxoft 失敗時靜默回退到 mouse_event
@@ -1,10 +1,14 @@
 # key_utils.py - 按鍵檢測模組
 """按鍵狀態檢測"""
 
-import win32api
+import ctypes
+
+# 於導入時解析一次 GetAsyncKeyState 並設定 argtypes/restype，省去 pywin32 的包裝開銷
+_GetAsyncKeyState = ctypes.WinDLL("user32", use_last_error=True).GetAsyncKeyState
+_GetAsyncKeyState.argtypes = [ctypes.c_int]
+_GetAsyncKeyState.restype = ctypes.c_short
 
 
 def is_key_pressed(key_code):
     """檢查指定按鍵是否被按下"""
-    return win32api.GetAsyncKeyState(key_code) & 0x8000 != 0
-
+    return _GetAsyncKeyState(key_code) & 0x8000 != 0
@@ -12,13 +12,21 @@ from .ddxoft_mouse import ddxoft_mouse
 _hardware_not_impl_warned = False
 logger = logging.getLogger(__name__)
 
+# 匯入時綁定一次，點擊時不必再經由模組屬性查找
+_mouse_event = win32api.mouse_event
+_LEFTDOWN = win32con.MOUSEEVENTF_LEFTDOWN
+_LEFTUP = win32con.MOUSEEVENTF_LEFTUP
+
+# xbox 點擊函數於首次使用時才匯入並保存，之後點擊不再經過匯入機制
+_xbox_click = None
+
 
 # ===== 滑鼠點擊函數 =====
 
 def send_mouse_click_sendinput():
     """SendInput 左鍵點擊"""
-    win32api.mouse_event(win32con.MOUSEEVENTF_LEFTDOWN, 0, 0, 0, 0)
-    win32api.mouse_event(win32con.MOUSEEVENTF_LEFTUP, 0, 0, 0, 0)
+    _mouse_event(_LEFTDOWN, 0, 0, 0, 0)
+    _mouse_event(_LEFTUP, 0, 0, 0, 0)
 
 
 def send_mouse_click_hardware():
@@ -37,14 +45,14 @@ def send_mouse_click_hardware():
 
 def send_mouse_click_mouse_event():
     """mouse_event 左鍵點擊"""
-    win32api.mouse_event(win32con.MOUSEEVENTF_LEFTDOWN, 0, 0, 0, 0)
-    win32api.mouse_event(win32con.MOUSEEVENTF_LEFTUP, 0, 0, 0, 0)
+    _mouse_event(_LEFTDOWN, 0, 0, 0, 0)
+    _mouse_event(_LEFTUP, 0, 0, 0, 0)
 
 
 def send_mouse_click_ddxoft():
     """ddxoft 左鍵點擊"""
     try:
-        if not ddxoft_mouse.ensure_initialized():
+        if not ddxoft_mouse.available and not ddxoft_mouse.ensure_initialized():
             send_mouse_click_mouse_event()
             return True
 
@@ -59,6 +67,15 @@ def send_mouse_click_ddxoft():
         return True
 
 
+# 點擊方式分派表（xbox 於首次使用時另行匯入）
+_CLICK_METHODS = {
+    "sendinput": send_mouse_click_sendinput,
+    "hardware": send_mouse_click_hardware,
+    "mouse_event": send_mouse_click_mouse_event,
+    "ddxoft": send_mouse_click_ddxoft,
+}
+
+
 def send_mouse_click(method="ddxoft"):
     """
     統一的滑鼠點擊函數，支援多種方式
@@ -69,21 +86,18 @@ def send_mouse_click(method="ddxoft"):
     - "ddxoft": ddxoft (最隱蔽，需要 ddxoft.dll)
     - "xbox": Xbox 360 虛擬手把 (RT 扳機)
     """
+    global _xbox_click
     try:
-        if method == "sendinput":
-            send_mouse_click_sendinput()
-        elif method == "hardware":
-            send_mouse_click_hardware()
-        elif method == "mouse_event":
-            send_mouse_click_mouse_event()
-        elif method == "ddxoft":
-            return send_mouse_click_ddxoft()
-        elif method == "xbox":
-            from .xbox_controller import send_mouse_click_xbox
-            return send_mouse_click_xbox()
-        else:
-            return send_mouse_click_ddxoft()  # 默認方式
-        return True
+        fn = _CLICK_METHODS.get(method)
+        if fn is None:
+            if method == "xbox":
+                if _xbox_click is None:
+                    from .xbox_controller import send_mouse_click_xbox as _xbox_click
+                fn = _xbox_click
+            else:
+                fn = send_mouse_click_ddxoft  # 默認方式
+        # sendinput / hardware / mouse_event 無返回值，視為成功
+        return fn() is not False
     except Exception:
         # 靜默回退到 mouse_event
         try:
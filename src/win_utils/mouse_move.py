@@ -3,7 +3,6 @@
 
 import ctypes
 import win32api
-import win32con
 
 
 # ===== 滑鼠輸入結構 =====
@@ -15,7 +14,7 @@ class MOUSEINPUT(ctypes.Structure):
         ("mouseData", ctypes.c_ulong),
         ("dwFlags", ctypes.c_ulong),
         ("time", ctypes.c_ulong),
-        ("dwExtraInfo", ctypes.POINTER(ctypes.c_ulong))
+        ("dwExtraInfo", ctypes.c_void_p)  # ULONG_PTR
     ]
 
 
@@ -29,22 +28,37 @@ class INPUT(ctypes.Structure):
 INPUT_MOUSE = 0
 MOUSEEVENTF_MOVE = 0x0001
 
+# 匯入時綁定一次，移動時不必再經由模組屬性查找
+_mouse_event = win32api.mouse_event
+
+# SendInput 使用的 INPUT 結構只建立一次，每次移動僅改寫 dx/dy
+_move_input = INPUT()
+_move_input.type = INPUT_MOUSE
+_move_input.mi = MOUSEINPUT(0, 0, 0, MOUSEEVENTF_MOVE, 0, 0)
+_move_mi = _move_input.mi
+_move_input_ref = ctypes.byref(_move_input)
+_INPUT_SIZE = ctypes.sizeof(INPUT)
+
+# 使用獨立的 WinDLL 實例並預先設定函數原型（不影響共用的 ctypes.windll），
+# 呼叫時不必每次推斷參數轉換
+_SendInput = ctypes.WinDLL("user32", use_last_error=True).SendInput
+_SendInput.argtypes = [ctypes.c_uint, ctypes.POINTER(INPUT), ctypes.c_int]
+_SendInput.restype = ctypes.c_uint
+
 
 # ===== 滑鼠移動方式 =====
 
 def send_mouse_move_sendinput(dx, dy):
     """SendInput API (原始方式，容易被檢測)"""
-    extra = ctypes.c_ulong(0)
-    ii_ = INPUT._INPUT_UNION()
-    ii_.mi = MOUSEINPUT(dx, dy, 0, MOUSEEVENTF_MOVE, 0, ctypes.pointer(extra))
-    command = INPUT(INPUT_MOUSE, ii_)
-    ctypes.windll.user32.SendInput(1, ctypes.byref(command), ctypes.sizeof(command))
+    _move_mi.dx = dx
+    _move_mi.dy = dy
+    _SendInput(1, _move_input_ref, _INPUT_SIZE)
 
 
 def send_mouse_move_mouse_event(dx, dy):
     """mouse_event 移動（直接執行）"""
     try:
-        win32api.mouse_event(win32con.MOUSEEVENTF_MOVE, dx, dy, 0, 0)
+        _mouse_event(MOUSEEVENTF_MOVE, dx, dy, 0, 0)
     except Exception:
         pass
 
@@ -50,10 +50,16 @@ def _launch_vigem_installer_and_exit() -> None:
     time.sleep(2)
     os._exit(0)
 
+# 搖桿全推所對應的滑鼠移動量（像素）
+_BASE_PIXELS = 50.0
+
 # vgamepad 採用 lazy import，僅在 connect() 被呼叫時才載入
 # 避免在模組匯入時觸發 ViGEmBus 驅動檢查
 vg = None
 
+# vgamepad 套件是否存在的快取（None 表示尚未檢查），見 XboxController.is_available
+_VGAMEPAD_PRESENT: Optional[bool] = None
+
 
 def _import_vgamepad():
     """嘗試匯入 vgamepad，若 ViGEmBus 未安裝則啟動安裝程式並結束程序"""
@@ -74,6 +80,20 @@ def _import_vgamepad():
         return False
 
 
+def _set_right_stick(gamepad, x: float, y: float) -> None:
+    """設定右搖桿 (-1.0~1.0)，需再呼叫 update() 才會送出
+
+    vgamepad 的 VX360Gamepad 公開 XUSB 報告 (report)，直接寫入 sThumbRX/sThumbRY，
+    省去 right_joystick_float 的參數檢查與轉換；沒有 report 的版本退回原 API。
+    """
+    report = getattr(gamepad, "report", None)
+    if report is None:
+        gamepad.right_joystick_float(x_value_float=x, y_value_float=y)
+    else:
+        report.sThumbRX = round(x * 32767)
+        report.sThumbRY = round(y * 32767)
+
+
 class XboxController:
     """Xbox 360 虛擬手把控制器
     
@@ -93,24 +113,56 @@ class XboxController:
         self._connected = False
         self._init_attempted = False
         
-        # 可調參數
-        self.sensitivity: float = 1.0
+        # 可調參數（sensitivity / max_stick_value 為屬性，設定時重新計算合併縮放係數）
+        self._sensitivity: float = 1.0
+        self._max_stick_value: float = 1.0
+        self._scale: float = 0.0
+        self._update_scale()
         self.deadzone: float = 0.05
         self.stick_duration: float = 0.03
-        self.max_stick_value: float = 1.0
+        
+        # 搖桿自動回中：move_right_stick 只記錄截止時間，由背景執行緒到期後回中
+        self._recenter_deadline: float = 0.0
+        self._recenter_event = threading.Event()
+        self._recenter_thread: Optional[threading.Thread] = None
         
         # 統計
         self._move_count: int = 0
         self._error_count: int = 0
         self._last_error: str = ""
     
+    @property
+    def sensitivity(self) -> float:
+        return self._sensitivity
+    
+    @sensitivity.setter
+    def sensitivity(self, value: float) -> None:
+        self._sensitivity = value
+        self._update_scale()
+    
+    @property
+    def max_stick_value(self) -> float:
+        return self._max_stick_value
+    
+    @max_stick_value.setter
+    def max_stick_value(self, value: float) -> None:
+        self._max_stick_value = value
+        self._update_scale()
+    
+    def _update_scale(self) -> None:
+        """合併靈敏度、像素基準與最大值為單一係數，移動時每軸只需一次乘法"""
+        self._scale = self._sensitivity * self._max_stick_value / _BASE_PIXELS
+    
     def is_available(self) -> bool:
-        """檢查 vgamepad 套件是否存在（不實際連線）"""
-        try:
-            import importlib.util
-            return importlib.util.find_spec("vgamepad") is not None
-        except Exception:
-            return False
+        """檢查 vgamepad 套件是否存在（不實際連線，結果於首次查詢後快取）"""
+        global _VGAMEPAD_PRESENT
+        if _VGAMEPAD_PRESENT is None:
+            try:
+                import importlib.util
+                _VGAMEPAD_PRESENT = importlib.util.find_spec("vgamepad") is not None
+            except Exception:
+                _VGAMEPAD_PRESENT = False
+        return _VGAMEPAD_PRESENT
     
     def is_connected(self) -> bool:
         """檢查虛擬手把是否已連線"""
@@ -164,6 +216,7 @@ class XboxController:
                     pass
                 self._gamepad = None
             self._connected = False
+            self._recenter_deadline = 0.0
             logger.info("[Xbox] 虛擬手把已斷開")
             print("[Xbox] 虛擬手把已斷開")
     
@@ -191,57 +244,61 @@ class XboxController:
         if not self.ensure_initialized():
             return False
         
-        with self._lock:
-            try:
-                # 應用靈敏度
-                scaled_x = dx * self.sensitivity
-                scaled_y = dy * self.sensitivity
-                
-                # 映射到 -1.0 ~ 1.0 範圍
-                # 使用非線性映射：較大的移動量產生較大的搖桿偏移
-                # 基準值：50 像素 = 搖桿全推
-                BASE_PIXELS = 50.0
-                norm_x = max(-1.0, min(1.0, scaled_x / BASE_PIXELS))
-                norm_y = max(-1.0, min(1.0, scaled_y / BASE_PIXELS))
-                
-                # 應用最大值限制
-                norm_x *= self.max_stick_value
-                norm_y *= self.max_stick_value
-                
-                # 死區處理
-                if abs(norm_x) < self.deadzone:
-                    norm_x = 0.0
-                if abs(norm_y) < self.deadzone:
-                    norm_y = 0.0
-                
-                if norm_x == 0.0 and norm_y == 0.0:
-                    return True
-                
+        # 映射到 -max_stick_value ~ max_stick_value 範圍
+        # 靈敏度、像素基準 (_BASE_PIXELS 像素 = 搖桿全推) 與最大值已合併為 _scale
+        scale = self._scale
+        limit = self._max_stick_value
+        norm_x = dx * scale
+        norm_y = dy * scale
+        if norm_x > limit:
+            norm_x = limit
+        elif norm_x < -limit:
+            norm_x = -limit
+        if norm_y > limit:
+            norm_y = limit
+        elif norm_y < -limit:
+            norm_y = -limit
+        
+        # 死區處理
+        deadzone = self.deadzone
+        if -deadzone < norm_x < deadzone:
+            norm_x = 0.0
+        if -deadzone < norm_y < deadzone:
+            norm_y = 0.0
+        
+        if norm_x == 0.0 and norm_y == 0.0:
+            return True
+        
+        try:
+            with self._lock:
+                gamepad = self._gamepad
+                if gamepad is None:
+                    return False
                 # 設定右搖桿值
-                # vgamepad 的 right_joystick_float: x_value_float, y_value_float
                 # Y 軸: vgamepad 中 正=上，但遊戲中下移= dy>0
-                # 所以反轉 Y 軸
-                self._gamepad.right_joystick_float(
-                    x_value_float=norm_x,
-                    y_value_float=-norm_y  # 反轉 Y
-                )
-                self._gamepad.update()
-                
-                # 短暫維持搖桿位置
-                if self.stick_duration > 0:
-                    time.sleep(self.stick_duration)
-                
-                # 釋放搖桿（回中）
-                self._gamepad.right_joystick_float(
-                    x_value_float=0.0,
-                    y_value_float=0.0
-                )
-                self._gamepad.update()
-                
+                # 所以反轉 Y 軸；每次移動只送出一次報告，回中由背景執行緒送出
+                _set_right_stick(gamepad, norm_x, -norm_y)
+                gamepad.update()
                 self._move_count += 1
-                return True
                 
-            except Exception as e:
+                if self.stick_duration > 0:
+                    # 維持搖桿位置不阻塞呼叫端：設定回中截止時間後立即返回，
+                    # 連續移動只會延後截止時間
+                    self._recenter_deadline = time.perf_counter() + self.stick_duration
+                    if self._recenter_thread is None:
+                        self._recenter_thread = threading.Thread(
+                            target=self._recenter_loop, name="XboxStickRecenter", daemon=True
+                        )
+                        self._recenter_thread.start()
+                    self._recenter_event.set()
+                else:
+                    # 釋放搖桿（回中）
+                    _set_right_stick(gamepad, 0.0, 0.0)
+                    gamepad.update()
+            return True
+            
+        except Exception as e:
+            with self._lock:
                 self._error_count += 1
                 self._last_error = str(e)
                 if self._error_count <= 3:
@@ -251,7 +308,36 @@ class XboxController:
                 if self._error_count > 5:
                     self._connected = False
                     self._gamepad = None
-                return False
+            return False
+    
+    def _recenter_loop(self) -> None:
+        """背景回中執行緒：等待截止時間到期後將右搖桿回中"""
+        while True:
+            self._recenter_event.wait()
+            self._recenter_event.clear()
+            
+            remaining = self._recenter_deadline - time.perf_counter()
+            while remaining > 0:
+                time.sleep(remaining)
+                remaining = self._recenter_deadline - time.perf_counter()
+            
+            with self._lock:
+                deadline = self._recenter_deadline
+                # 等待期間若有新移動延後了截止時間，交由下一輪處理
+                if deadline == 0.0 or deadline > time.perf_counter():
+                    continue
+                self._recenter_deadline = 0.0
+                gamepad = self._gamepad
+                if gamepad is None:
+                    continue
+                try:
+                    _set_right_stick(gamepad, 0.0, 0.0)
+                    gamepad.update()
+                except Exception as e:
+                    self._error_count += 1
+                    self._last_error = str(e)
+                    if self._error_count <= 3:
+                        logger.error(f"[Xbox] 右搖桿回中失敗: {e}")
     
     def press_button(self, button) -> bool:
         """按下手把按鈕
@@ -346,7 +432,7 @@ class XboxController:
         """取得統計資料"""
         return {
             "connected": self._connected,
-            "available": HAS_VGAMEPAD,
+            "available": self.is_available(),
             "move_count": self._move_count,
             "error_count": self._error_count,
             "last_error": self._last_error,